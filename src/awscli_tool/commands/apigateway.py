@@ -11,6 +11,7 @@ from rich.table import Table
 
 from awscli_tool.config import select_profile, ensure_sso_login
 from awscli_tool.utils.aws_client import get_client
+from awscli_tool.utils.ttl_cache import ttl_cached
 
 console = Console()
 app = typer.Typer(no_args_is_help=True)
@@ -19,6 +20,7 @@ app = typer.Typer(no_args_is_help=True)
 HTTP_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD", "ANY"]
 
 
+@ttl_cached(30)
 def list_apis(apigw_client) -> list[dict]:
     """List all HTTP APIs (API Gateway v2)."""
     apis = []
@@ -1,45 +1,93 @@
 """ECS commands - interactive wizard and direct commands."""
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from typing import Optional
 
 import shutil
 import subprocess
+import time
 import typer
 from InquirerPy import inquirer
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
+from rich.text import Text
 
 from awscli_tool.config import select_profile, ensure_sso_login
 from awscli_tool.utils.aws_client import get_client
 from awscli_tool.utils.log_formatter import display_logs
+from awscli_tool.utils.prefetch import prefetch
+from awscli_tool.utils.ttl_cache import ttl_cached
 
 console = Console()
 app = typer.Typer(no_args_is_help=False)
 
+# Clusters whose services are listed ahead while the user picks one (the
+# rest are listed on demand, to keep big accounts clear of throttling)
+PREFETCH_CLUSTERS = 10
 
+# First (newest) window read by fetch_log_events; each older one doubles
+LOG_WINDOW_MS = 5 * 60 * 1000
+# Pages fetch_log_events reads at most, over all windows (a level filter
+# that rarely matches would otherwise scan every page of the range), and
+# per window before it retries with a narrower one
+MAX_LOG_PAGES = 20
+WINDOW_LOG_PAGES = 5
+
+# CloudWatch filter patterns are case-sensitive, so each level is an OR of its spellings
+LEVEL_FILTER_PATTERNS = {
+    "ERROR": "?ERROR ?Error ?error",
+    "WARN": "?WARN ?Warn ?warn ?WARNING ?Warning ?warning",
+    "INFO": "?INFO ?Info ?info",
+}
+
+
+@ttl_cached(30)
 def list_clusters(ecs_client) -> list[str]:
     """List all ECS clusters."""
     paginator = ecs_client.get_paginator("list_clusters")
     clusters = []
     for page in paginator.paginate():
         clusters.extend(page["clusterArns"])
-    return [c.split("/")[-1] for c in clusters]
+    return [c.rpartition("/")[2] for c in clusters]
 
 
+@ttl_cached(30)
 def list_services(ecs_client, cluster: str) -> list[str]:
     """List all services in a cluster."""
     paginator = ecs_client.get_paginator("list_services")
     services = []
-    for page in paginator.paginate(cluster=cluster):
+    # ListServices returns 10 per page by default; 100 is the API maximum
+    for page in paginator.paginate(cluster=cluster, PaginationConfig={"PageSize": 100}):
         services.extend(page["serviceArns"])
     # Sort purely by service name (case incentive)
-    service_names = [s.split("/")[-1] for s in services]
+    service_names = [s.rpartition("/")[2] for s in services]
     service_names.sort(key=str.lower)
     return service_names
 
 
+def prefetch_services(ecs_client, clusters: list[str]):
+    """
+    Context manager listing services while the user picks a cluster.
+    
+    Only the first PREFETCH_CLUSTERS clusters are listed ahead (futures by
+    cluster name); use services_of() to read a cluster's services.
+    """
+    return prefetch({c: partial(list_services, ecs_client, c) for c in clusters[:PREFETCH_CLUSTERS]})
+
+
+def services_of(ecs_client, cluster: str, service_futures: dict) -> list[str]:
+    """Services of `cluster`, from its prefetch future when there is one."""
+    future = service_futures.get(cluster)
+    if future is not None:
+        return future.result()
+    return list_services(ecs_client, cluster)
+
+
 def get_service_details(ecs_client, cluster: str, service: str) -> dict:
     """Get detailed info about a service."""
     response = ecs_client.describe_services(cluster=cluster, services=[service])
@@ -50,26 +98,28 @@ def get_service_details(ecs_client, cluster: str, service: str) -> dict:
 
 def get_tasks(ecs_client, cluster: str, service: str) -> list[dict]:
     """Get running tasks for a service."""
-    response = ecs_client.list_tasks(cluster=cluster, serviceName=service)
-    task_arns = response.get("taskArns", [])
+    paginator = ecs_client.get_paginator("list_tasks")
+    task_arns = []
+    for page in paginator.paginate(cluster=cluster, serviceName=service, PaginationConfig={"PageSize": 100}):
+        task_arns.extend(page.get("taskArns", []))
     
     if not task_arns:
         return []
     
-    tasks_response = ecs_client.describe_tasks(cluster=cluster, tasks=task_arns)
-    return tasks_response.get("tasks", [])
+    # DescribeTasks accepts at most 100 ARNs per call
+    chunks = [task_arns[i:i + 100] for i in range(0, len(task_arns), 100)]
+    if len(chunks) == 1:
+        return ecs_client.describe_tasks(cluster=cluster, tasks=chunks[0]).get("tasks", [])
+    
+    with ThreadPoolExecutor(max_workers=min(len(chunks), 8)) as executor:
+        responses = executor.map(lambda chunk: ecs_client.describe_tasks(cluster=cluster, tasks=chunk), chunks)
+        return [task for response in responses for task in response.get("tasks", [])]
 
 
-def get_container_log_groups(ecs_client, cluster: str, service: str) -> dict[str, str]:
-    """Get CloudWatch log groups for all containers in the service."""
+def get_container_log_groups(ecs_client, task_def_arn: str) -> dict[str, str]:
+    """Get CloudWatch log groups for all containers in a task definition."""
     log_groups = {}
     try:
-        service_response = ecs_client.describe_services(cluster=cluster, services=[service])
-        
-        if not service_response["services"]:
-            return {}
-        
-        task_def_arn = service_response["services"][0]["taskDefinition"]
         task_def = ecs_client.describe_task_definition(taskDefinition=task_def_arn)
         container_defs = task_def["taskDefinition"]["containerDefinitions"]
         
@@ -87,43 +137,129 @@ def get_container_log_groups(ecs_client, cluster: str, service: str) -> dict[str
         return {}
 
 
+def fetch_log_events(logs_client, log_group: str, start_time: int, tail: int, level_filter: Optional[str] = None) -> list[dict]:
+    """
+    Fetch the last `tail` log events of a log group since `start_time`.
+    
+    CloudWatch returns events oldest -> newest, so instead of paging through
+    the whole range the time is read backwards in windows (LOG_WINDOW_MS,
+    doubling each step) until `tail` events are found, `start_time` is
+    reached or MAX_LOG_PAGES pages have been read. A window that cannot be
+    read to the end still contributes the events read from it.
+    """
+    kwargs = {
+        "logGroupName": log_group,
+        "PaginationConfig": {"PageSize": 10000},
+    }
+    
+    needle = level_filter.upper() if level_filter else None
+    
+    # Let CloudWatch do the level matching when we know a pattern for it
+    if needle in LEVEL_FILTER_PATTERNS:
+        kwargs["filterPattern"] = LEVEL_FILTER_PATTERNS[needle]
+        needle = None
+    
+    paginator = logs_client.get_paginator("filter_log_events")
+    windows = []  # newest first, each sorted by time
+    partial = []  # most events read from the current window without finishing it
+    found = 0
+    end = int(time.time() * 1000)
+    span = LOG_WINDOW_MS
+    pages_left = MAX_LOG_PAGES
+    truncated = False
+    
+    while found < tail and end > start_time:
+        begin = max(start_time, end - span)
+        # endTime is inclusive; the next (older) window ends right before begin
+        pages = paginator.paginate(startTime=begin, endTime=end - 1, **kwargs)
+        
+        window = []
+        page = {}
+        for page in islice(pages, min(pages_left, WINDOW_LOG_PAGES)):
+            pages_left -= 1
+            # CloudWatch may return empty pages while the token still advances
+            events = page.get("events", [])
+            if needle:
+                events = [e for e in events if needle in e.get("message", "").upper()]
+            window.extend(events)
+        
+        if "nextToken" in page:
+            # Too many events to read this window to its end: try a narrower
+            # one ending at the same time while pages are left, else settle
+            # for the most events read (pages go stream by stream, so they
+            # are not necessarily the newest ones)
+            if len(window) > len(partial):
+                partial = window
+            if pages_left and span > 1000:
+                span = max(span // 8, 1000)
+                continue
+            window, truncated = partial, True
+        partial = []
+        
+        # Events of several streams come interleaved, not in time order
+        window.sort(key=lambda e: e["timestamp"])
+        windows.append(window[-tail:])
+        found += len(windows[-1])
+        if truncated:
+            break
+        end = begin
+        span *= 2
+        if not pages_left:
+            truncated = end > start_time
+            break
+    
+    if truncated:
+        console.print(f"[dim]⚠ Busca limitada a {MAX_LOG_PAGES} páginas de logs; exibindo o que foi encontrado.[/dim]")
+    
+    events = (event for window in reversed(windows) for event in window)
+    return list(deque(events, maxlen=tail))
+
+
 def display_service_info(service_details: dict, tasks: list[dict]):
     """Display service information panel."""
     running = service_details.get("runningCount", 0)
     desired = service_details.get("desiredCount", 0)
     status = service_details.get("status", "UNKNOWN")
-    task_def = service_details.get("taskDefinition", "").split("/")[-1]
+    task_def = service_details.get("taskDefinition", "").rpartition("/")[2]
     
     status_color = "green" if status == "ACTIVE" else "yellow"
     running_color = "green" if running == desired else "red"
     
-    info = f"""[bold]Status:[/bold] [{status_color}]{status}[/]
-[bold]Task Definition:[/bold] {task_def}
-[bold]Tasks:[/bold] [{running_color}]{running}/{desired}[/] running
-"""
+    lines = [
+        f"[bold]Status:[/bold] [{status_color}]{status}[/]",
+        f"[bold]Task Definition:[/bold] {task_def}",
+        f"[bold]Tasks:[/bold] [{running_color}]{running}/{desired}[/] running",
+        "",
+    ]
     
     if tasks:
-        info += "\n[bold]Running Tasks:[/bold]\n"
+        lines.append("[bold]Running Tasks:[/bold]")
         for task in tasks:
-            task_id = task["taskArn"].split("/")[-1][:8]
+            task_id = task["taskArn"].rpartition("/")[2][:8]
             task_status = task.get("lastStatus", "UNKNOWN")
             health = task.get("healthStatus", "UNKNOWN")
-            info += f"  • {task_id} - {task_status} (health: {health})\n"
+            lines.append(f"  • {task_id} - {task_status} (health: {health})")
     else:
-        info += "\n[yellow]⚠ Nenhuma task rodando![/yellow]\n"
+        lines.append("[yellow]⚠ Nenhuma task rodando![/yellow]")
     
-    console.print(Panel(info, title="📦 Service Info", border_style="cyan"))
+    lines.append("")
+    console.print(Panel("\n".join(lines), title="📦 Service Info", border_style="cyan"))
 
 
-def view_logs_action(ecs_client, logs_client, cluster: str, service: str):
+def view_logs_action(ecs_client, logs_client, cluster: str, service: str, service_details: dict):
     """View logs for the service."""
+    task_def_arn = service_details.get("taskDefinition")
+    if not task_def_arn:
+        console.print("[red]❌ Task definition do service não encontrada.[/red]")
+        return
+    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
         progress.add_task("Buscando configuração de logs...", total=None)
-        log_groups = get_container_log_groups(ecs_client, cluster, service)
+        log_groups = get_container_log_groups(ecs_client, task_def_arn)
     
     if not log_groups:
         console.print("[red]❌ Nenhum log group configurado (awslogs) encontrado.[/red]")
@@ -173,6 +309,11 @@ def view_logs_action(ecs_client, logs_client, cluster: str, service: str):
         ],
     ).execute()
     
+    pretty_json = inquirer.confirm(
+        message="Exibir mensagens JSON formatadas?",
+        default=False,
+    ).execute()
+    
     console.print(f"[dim]Container: {container_name}[/dim]")
     console.print(f"[dim]Log group: {log_group}[/dim]\n")
     
@@ -185,30 +326,10 @@ def view_logs_action(ecs_client, logs_client, cluster: str, service: str):
             progress.add_task("Buscando logs...", total=None)
             
             # Calculate start time (1 hour ago) to get recent logs
-            import time
             start_time = int((time.time() - 3600) * 1000)
-
-            # fetch without API limit to get full window (up to 10k), then slice tail
-            response = logs_client.filter_log_events(
-                logGroupName=log_group,
-                startTime=start_time,
-                interleaved=True,
-            )
-        
-        events = response.get("events", [])
+            events = fetch_log_events(logs_client, log_group, start_time, int(tail), level_filter)
         
-        if level_filter:
-            events = [
-                e for e in events
-                if level_filter in e.get("message", "").upper()
-            ]
-            
-        # Apply tail locally
-        actual_tail = int(tail)
-        if len(events) > actual_tail:
-            events = events[-actual_tail:]
-        
-        display_logs(events, service, cluster)
+        display_logs(events, service, cluster, pretty_json)
         
     except Exception as e:
         console.print(f"[red]❌ Erro ao buscar logs: {e}[/red]")
@@ -234,7 +355,7 @@ def view_tasks_action(ecs_client, cluster: str, service: str):
     table.add_column("CPU/Memory")
     
     for task in tasks:
-        task_id = task["taskArn"].split("/")[-1][:12]
+        task_id = task["taskArn"].rpartition("/")[2][:12]
         status = task.get("lastStatus", "UNKNOWN")
         health = task.get("healthStatus", "UNKNOWN")
         
@@ -250,8 +371,8 @@ def view_tasks_action(ecs_client, cluster: str, service: str):
         
         table.add_row(
             task_id,
-            f"[{status_style}]{status}[/]",
-            f"[{health_style}]{health}[/]",
+            Text(status, style=status_style),
+            Text(health, style=health_style),
             str(started),
             f"{cpu}/{memory}",
         )
@@ -259,8 +380,13 @@ def view_tasks_action(ecs_client, cluster: str, service: str):
     console.print(table)
 
 
-def force_task_action(ecs_client, cluster: str, service: str):
-    """Force new deployment."""
+def force_task_action(ecs_client, cluster: str, service: str) -> Optional[dict]:
+    """
+    Force new deployment.
+    
+    Returns the updated service description from `update_service`, or None
+    if the deploy was cancelled or failed.
+    """
     console.print(Panel(
         f"[yellow]⚠ Você está prestes a forçar um novo deploy:[/yellow]\n\n"
         f"  Cluster: [cyan]{cluster}[/cyan]\n"
@@ -277,7 +403,7 @@ def force_task_action(ecs_client, cluster: str, service: str):
     
     if not confirm:
         console.print("[dim]Operação cancelada.[/dim]")
-        return
+        return None
     
     try:
         with Progress(
@@ -293,17 +419,20 @@ def force_task_action(ecs_client, cluster: str, service: str):
                 forceNewDeployment=True,
             )
         
-        deployment = response["service"]["deployments"][0]
+        updated_service = response.get("service", {})
+        deployment = (updated_service.get("deployments") or [{}])[0]
         console.print(Panel(
             f"[green]✓ Deploy iniciado com sucesso![/green]\n\n"
-            f"  Deployment ID: [cyan]{deployment['id']}[/cyan]\n"
-            f"  Status: [cyan]{deployment['status']}[/cyan]",
+            f"  Deployment ID: [cyan]{deployment.get('id', 'N/A')}[/cyan]\n"
+            f"  Status: [cyan]{deployment.get('status', 'N/A')}[/cyan]",
             title="Deploy Status",
             border_style="green",
         ))
+        return updated_service
         
     except Exception as e:
         console.print(f"[red]❌ Erro ao forçar deploy: {e}[/red]")
+        return None
 
 
 
@@ -335,7 +464,7 @@ def execute_command_action(ecs_client, cluster: str, service: str, profile: str)
     task_arn = running_tasks[0]["taskArn"]
     if len(running_tasks) > 1:
         choices = [
-            {"name": f"{t['taskArn'].split('/')[-1]} ({t.get('healthStatus', 'UNKNOWN')})", "value": t["taskArn"]}
+            {"name": f"{t['taskArn'].rpartition('/')[2]} ({t.get('healthStatus', 'UNKNOWN')})", "value": t["taskArn"]}
             for t in running_tasks
         ]
         task_arn = inquirer.select(message="Selecione a task:", choices=choices).execute()
@@ -374,16 +503,24 @@ def execute_command_action(ecs_client, cluster: str, service: str, profile: str)
 
 def interactive_menu(ecs_client, logs_client, cluster: str, service: str, profile: str = None):
     """Show interactive action menu for a service."""
+    service_details, tasks = {}, []
+    # Only re-fetch after actions that may have changed the service
+    dirty = True
+    
     while True:
-        # Get fresh service info
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Carregando informações...", total=None)
-            service_details = get_service_details(ecs_client, cluster, service)
-            tasks = get_tasks(ecs_client, cluster, service)
+        if dirty:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                progress.add_task("Carregando informações...", total=None)
+                with prefetch({
+                    "details": partial(get_service_details, ecs_client, cluster, service),
+                    "tasks": partial(get_tasks, ecs_client, cluster, service),
+                }) as futures:
+                    service_details, tasks = futures["details"].result(), futures["tasks"].result()
+            dirty = False
         
         console.print(f"\n[bold cyan]📦 {service}[/bold cyan] @ [dim]{cluster}[/dim]\n")
         display_service_info(service_details, tasks)
@@ -411,12 +548,16 @@ def interactive_menu(ecs_client, logs_client, cluster: str, service: str, profil
         if action == "exec":
             execute_command_action(ecs_client, cluster, service, profile)
         elif action == "logs":
-            view_logs_action(ecs_client, logs_client, cluster, service)
+            view_logs_action(ecs_client, logs_client, cluster, service, service_details)
         elif action == "tasks":
             view_tasks_action(ecs_client, cluster, service)
         elif action == "force":
-            force_task_action(ecs_client, cluster, service)
+            updated_service = force_task_action(ecs_client, cluster, service)
+            if updated_service:
+                # update_service already returns the new state; no need to describe again
+                service_details = updated_service
         elif action == "refresh":
+            dirty = True
             continue
         elif action == "back":
             return "back"
@@ -475,30 +616,31 @@ def ecs_wizard(
             console.print("[red]❌ Nenhum cluster encontrado![/red]")
             raise typer.Exit(1)
         
-        cluster_choices = clusters + ["❌ Sair"]
-        cluster = inquirer.select(
-            message="📦 Selecione o cluster:",
-            choices=cluster_choices,
-        ).execute()
-        
-        if cluster == "❌ Sair":
-            console.print("[dim]Até logo! 👋[/dim]")
-            break
-        
-        # Select service
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task(f"Carregando services...", total=None)
-            services = list_services(ecs_client, cluster)
+        with prefetch_services(ecs_client, clusters) as service_futures:
+            cluster_choices = clusters + ["❌ Sair"]
+            cluster = inquirer.select(
+                message="📦 Selecione o cluster:",
+                choices=cluster_choices,
+            ).execute()
+            
+            if cluster == "❌ Sair":
+                console.print("[dim]Até logo! 👋[/dim]")
+                break
+            
+            # Select service
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                progress.add_task(f"Carregando services...", total=None)
+                services = services_of(ecs_client, cluster, service_futures)
         
         if not services:
             console.print(f"[yellow]⚠ Nenhum service encontrado no cluster {cluster}[/yellow]")
             continue
         
-        service_choices = [{"name": s.split("/")[-1], "value": s.split("/")[-1]} for s in services]
+        service_choices = [{"name": s, "value": s} for s in services]
         service_choices.append({"name": "◀️  Voltar", "value": "back"})
 
         service = inquirer.fuzzy(
@@ -532,6 +674,7 @@ def view_logs(
     tail: int = typer.Option(50, "--tail", "-n", help="Número de linhas para exibir"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="AWS profile (SSO)"),
     filter_level: Optional[str] = typer.Option(None, "--level", "-l", help="Filtrar por nível (ERROR, WARN, INFO)"),
+    pretty_json: bool = typer.Option(False, "--json", "-j", help="Exibir mensagens JSON formatadas"),
 ):
     """
     📋 Visualizar logs do ECS (modo direto).
@@ -561,7 +704,7 @@ def view_logs(
             console.print(f"[yellow]⚠ Nenhum service encontrado no cluster {cluster}[/yellow]")
             raise typer.Exit(1)
             
-        service_choices = [{"name": s.split("/")[-1], "value": s.split("/")[-1]} for s in services]
+        service_choices = [{"name": s, "value": s} for s in services]
         
         while True:
             service = inquirer.fuzzy(
@@ -576,7 +719,12 @@ def view_logs(
                 break
             console.print("[yellow]⚠ Seleção inválida. Tente novamente.[/yellow]")
     
-    log_groups = get_container_log_groups(ecs_client, cluster, service)
+    service_details = get_service_details(ecs_client, cluster, service)
+    if not service_details:
+        console.print(f"[red]❌ Service {service} não encontrado no cluster {cluster}[/red]")
+        raise typer.Exit(1)
+    
+    log_groups = get_container_log_groups(ecs_client, service_details["taskDefinition"])
     if not log_groups:
         console.print("[red]❌ Log groups não encontrados (verifique se usar awslogs driver)[/red]")
         raise typer.Exit(1)
@@ -652,31 +800,16 @@ def view_logs(
     # If we set limit in API, it returns the OLDEST N logs from startTime.
     # So strategy: 
     # 1. Look back 60m. 
-    # 2. Fetch up to 10k logs (limit=None in API calls defaults to max page).
-    # 3. Slice the LAST N (tail) locally.
-    import time
+    # 2. Page through the whole window.
+    # 3. Keep only the LAST N (tail) locally.
     start_time = int((time.time() - 3600) * 1000) # 1 hour ago in ms
 
     console.print(f"\n[dim]Visualizando logs de {cluster}/{service}/{container_name} (última 1h)[/dim]")
 
     try:
-        # Don't pass 'limit' to API to avoid getting only the oldest logs of the window
-        response = logs_client.filter_log_events(
-            logGroupName=log_group, 
-            startTime=start_time,
-            interleaved=True
-        )
-        events = response.get("events", [])
-        
-        # Filter by level content
-        if filter_level:
-            events = [e for e in events if filter_level.upper() in e.get("message", "").upper()]
-            
-        # Apply tail locally
-        if len(events) > tail:
-            events = events[-tail:]
+        events = fetch_log_events(logs_client, log_group, start_time, tail, filter_level)
         
-        display_logs(events, service, cluster)
+        display_logs(events, service, cluster, pretty_json)
         
     except Exception as e:
         console.print(f"[red]❌ Erro ao buscar logs: {e}[/red]")
@@ -716,5 +849,5 @@ def force_new_task(
             return
     
     response = ecs_client.update_service(cluster=cluster, service=service, forceNewDeployment=True)
-    deployment = response["service"]["deployments"][0]
-    console.print(f"[green]✓ Deploy iniciado![/green] ID: {deployment['id']}")
+    deployment = (response.get("service", {}).get("deployments") or [{}])[0]
+    console.print(f"[green]✓ Deploy iniciado![/green] ID: {deployment.get('id', 'N/A')}")
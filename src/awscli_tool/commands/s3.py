@@ -1,8 +1,11 @@
 """S3 Browser commands."""
 
 import os
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache, partial
+from typing import Iterator, Optional
 
 import typer
 from InquirerPy import inquirer
@@ -12,35 +15,117 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, Downlo
 from rich.table import Table
 
 from awscli_tool.config import select_profile, ensure_sso_login
-from awscli_tool.utils.aws_client import get_client
+from awscli_tool.utils.aws_client import SERVICE_CONFIGS, get_client
+from awscli_tool.utils.prefetch import background
 
 console = Console()
 app = typer.Typer(no_args_is_help=False)
 
 
+@lru_cache(maxsize=None)
+def transfer_config():
+    """
+    Bigger parts and more parallel part transfers than boto3's defaults.
+    
+    Built on first use so importing this module does not load boto3. The
+    thread count matches the S3 client's connection pool, so no transfer
+    thread has to open (and then discard) a connection of its own.
+    """
+    from boto3.s3.transfer import TransferConfig
+    
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=16 * 1024 * 1024,
+        max_concurrency=SERVICE_CONFIGS["s3"]["max_pool_connections"],
+        io_chunksize=1024 * 1024,
+        use_threads=True,
+    )
+
+
+class ThrottledProgressCallback:
+    """
+    Transfer callback that accumulates bytes and redraws at most ~30 times/s.
+    
+    boto3 fires the callback for every chunk, which would otherwise repaint
+    the progress bar thousands of times on large files.
+    """
+    
+    def __init__(self, progress: Progress, task, interval: float = 0.033):
+        self.progress = progress
+        self.task = task
+        self.interval = interval
+        self.bytes = 0
+        self.last = time.monotonic()
+        # boto3 invokes the callback from its transfer threads
+        self._lock = threading.Lock()
+    
+    def __call__(self, bytes_transferred: int):
+        with self._lock:
+            self.bytes += bytes_transferred
+            now = time.monotonic()
+            if now - self.last <= self.interval:
+                return
+            self.last = now
+            # Update under the lock so threads cannot push counts out of order
+            self.progress.update(self.task, completed=self.bytes)
+    
+    def flush(self):
+        """Push the final byte count to the progress bar."""
+        with self._lock:
+            self.progress.update(self.task, completed=self.bytes)
+
+
 def list_buckets(s3_client) -> list[dict]:
     """List all buckets."""
     response = s3_client.list_buckets()
     return response.get("Buckets", [])
 
 
-def list_objects(s3_client, bucket: str, prefix: str = "") -> dict:
-    """List objects and 'folders' (prefixes) in a bucket path."""
-    response = s3_client.list_objects_v2(
-        Bucket=bucket,
-        Prefix=prefix,
-        Delimiter="/"
-    )
+def list_objects(s3_client, bucket: str, prefix: str = "") -> Iterator[dict]:
+    """
+    List objects and 'folders' (prefixes) in a bucket path, page by page.
     
-    folders = response.get("CommonPrefixes", [])
-    files = response.get("Contents", [])
+    Yields one dict per page, so callers can render the first page before
+    the whole listing has arrived. Each page holds `folders` (prefixes),
+    the parallel lists `keys`, `sizes` and `mods` for the files, and
+    `truncated` (whether more pages follow).
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
     
-    return {"folders": folders, "files": files}
+    for page in paginator.paginate(
+        Bucket=bucket,
+        Prefix=prefix,
+        Delimiter="/",
+        PaginationConfig={"PageSize": 1000},
+    ):
+        contents = page.get("Contents", [])
+        yield {
+            "folders": [p["Prefix"] for p in page.get("CommonPrefixes", [])],
+            "keys": [obj["Key"] for obj in contents],
+            "sizes": [obj["Size"] for obj in contents],
+            "mods": [obj["LastModified"] for obj in contents],
+            "truncated": page.get("IsTruncated", False),
+        }
+
 
+def drain_pages(pages: Iterator[dict], stop: threading.Event) -> list[dict]:
+    """Consume the remaining listing pages until exhausted or `stop` is set."""
+    remaining = []
+    for page in pages:
+        if stop.is_set():
+            break
+        remaining.append(page)
+    return remaining
 
-def download_file(s3_client, bucket: str, key: str):
-    """Download a file from S3 to current directory."""
-    filename = key.split("/")[-1]
+
+def download_file(s3_client, bucket: str, key: str, size: Optional[int] = None):
+    """
+    Download a file from S3 to current directory.
+    
+    If `size` is already known (e.g. from the listing), the extra
+    `head_object` call used to size the progress bar is skipped.
+    """
+    filename = key.rpartition("/")[2]
     
     if os.path.exists(filename):
         confirm = inquirer.confirm(
@@ -53,8 +138,10 @@ def download_file(s3_client, bucket: str, key: str):
 
     try:
         # Get file size for progress bar
-        head = s3_client.head_object(Bucket=bucket, Key=key)
-        total_bytes = head["ContentLength"]
+        total_bytes = size
+        if total_bytes is None:
+            head = s3_client.head_object(Bucket=bucket, Key=key)
+            total_bytes = head["ContentLength"]
 
         with Progress(
             SpinnerColumn(),
@@ -65,13 +152,16 @@ def download_file(s3_client, bucket: str, key: str):
             console=console,
         ) as progress:
             task = progress.add_task(f"Baixando {filename}...", total=total_bytes)
+            callback = ThrottledProgressCallback(progress, task)
             
             s3_client.download_file(
                 Bucket=bucket, 
                 Key=key, 
                 Filename=filename,
-                Callback=lambda bytes_transferred: progress.update(task, advance=bytes_transferred)
+                Callback=callback,
+                Config=transfer_config(),
             )
+            callback.flush()
             
         console.print(f"[green]✓ Download concluído:[/green] {filename}")
         
@@ -110,13 +200,16 @@ def upload_file(s3_client, bucket: str, prefix: str):
             console=console,
         ) as progress:
             task = progress.add_task(f"Enviando {file_to_upload}...", total=file_size)
+            callback = ThrottledProgressCallback(progress, task)
             
             s3_client.upload_file(
                 Filename=file_to_upload,
                 Bucket=bucket,
                 Key=key,
-                Callback=lambda bytes_transferred: progress.update(task, advance=bytes_transferred)
+                Callback=callback,
+                Config=transfer_config(),
             )
+            callback.flush()
             
         console.print(f"[green]✓ Upload concluído:[/green] s3://{bucket}/{key}")
         
@@ -124,13 +217,14 @@ def upload_file(s3_client, bucket: str, prefix: str):
         console.print(f"[red]❌ Erro no upload: {e}[/red]")
 
 
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def format_size(size_bytes: int) -> str:
     """Format bytes to human readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
+    idx = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1) if size_bytes > 0 else 0
+    return f"{size_bytes / (1 << (idx * 10)):.2f} {SIZE_UNITS[idx]}"
 
 
 def interactive_s3_browser(s3_client):
@@ -181,44 +275,72 @@ def interactive_s3_browser(s3_client):
             console=console,
         ) as progress:
             progress.add_task("Carregando conteúdo...", total=None)
-            content = list_objects(s3_client, current_bucket, current_prefix)
-            
-        folders = content["folders"]
-        files = content["files"]
+            pages = list_objects(s3_client, current_bucket, current_prefix)
+            first_page = next(pages, {"folders": [], "keys": [], "sizes": [], "mods": [], "truncated": False})
         
-        # Build choices
-        choices = []
+        folders = first_page["folders"]
+        keys, sizes, mods = first_page["keys"], first_page["sizes"], first_page["mods"]
         
-        # Navigation options
-        if current_prefix:
-            choices.append({"name": "📂 .. (Subir nível)", "value": ".."})
-        else:
-            choices.append({"name": "📂 .. (Voltar aos buckets)", "value": ".."})
-            
-        # Upload action
-        choices.append({"name": "⬆️  Upload Arquivo (Aqui)", "value": "upload_action"})
+        # Keep fetching the remaining pages while the user looks at the first one
+        stop_loading = threading.Event()
+        remaining = None
+        if first_page["truncated"]:
+            remaining = background({"rest": partial(drain_pages, pages, stop_loading)})["rest"]
+        
+        while True:
+            # Build choices
+            choices = []
             
-        # Folders
-        for f in folders:
-            folder_name = f["Prefix"].split("/")[-2] + "/" # Get last part
-            choices.append({"name": f"📁 {folder_name}", "value": f"folder:{f['Prefix']}"})
+            # Navigation options
+            if current_prefix:
+                choices.append({"name": "📂 .. (Subir nível)", "value": ".."})
+            else:
+                choices.append({"name": "📂 .. (Voltar aos buckets)", "value": ".."})
+                
+            # Upload action
+            choices.append({"name": "⬆️  Upload Arquivo (Aqui)", "value": "upload_action"})
+                
+            # Folders
+            for folder in folders:
+                folder_name = folder[:-1].rpartition("/")[2] + "/" # Get last part
+                choices.append({"name": f"📁 {folder_name}", "value": f"folder:{folder}"})
+                
+            # Files
+            for key, size, mod in zip(keys, sizes, mods):
+                file_name = key.rpartition("/")[2]
+                if not file_name: continue # Ignore empty keys (folder placeholders)
+                
+                choices.append({
+                    "name": f"📄 {file_name} ({format_size(size)}) - {mod.strftime('%Y-%m-%d %H:%M')}", 
+                    "value": f"file:{key}"
+                })
             
-        # Files
-        for f in files:
-            file_name = f["Key"].split("/")[-1]
-            if not file_name: continue # Ignore empty keys (folder placeholders)
+            if remaining is not None:
+                choices.append({"name": "⏬ Carregar restante da listagem...", "value": "load_more"})
+                
+            selection = inquirer.select(
+                message="Navegar:",
+                choices=choices,
+            ).execute()
             
-            size = format_size(f["Size"])
-            last_mod = f["LastModified"].strftime("%Y-%m-%d %H:%M")
-            choices.append({
-                "name": f"📄 {file_name} ({size}) - {last_mod}", 
-                "value": f"file:{f['Key']}"
-            })
+            if selection != "load_more":
+                break
             
-        selection = inquirer.select(
-            message="Navegar:",
-            choices=choices,
-        ).execute()
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                progress.add_task("Carregando restante...", total=None)
+                for page in remaining.result():
+                    folders.extend(page["folders"])
+                    keys.extend(page["keys"])
+                    sizes.extend(page["sizes"])
+                    mods.extend(page["mods"])
+            remaining = None
+        
+        # Stop the background listing if the user moved on before it finished
+        stop_loading.set()
         
         # Handle selection
         if selection == "..":
@@ -226,12 +348,9 @@ def interactive_s3_browser(s3_client):
                 current_bucket = None # Back to bucket list
             else:
                 # Go up one level
-                # Remove trailing slash, split, remove last part, join, add trailing slash
-                parts = current_prefix.rstrip("/").split("/")
-                if len(parts) <= 1:
-                    current_prefix = ""
-                else:
-                    current_prefix = "/".join(parts[:-1]) + "/"
+                # Remove trailing slash, drop the last part, add trailing slash back
+                parent = current_prefix.rstrip("/").rpartition("/")[0]
+                current_prefix = f"{parent}/" if parent else ""
                     
         elif selection == "upload_action":
             upload_file(s3_client, current_bucket, current_prefix)
@@ -245,7 +364,7 @@ def interactive_s3_browser(s3_client):
             key = selection.split(":", 1)[1]
             
             action = inquirer.select(
-                message=f"Arquivo: {key.split('/')[-1]}",
+                message=f"Arquivo: {key.rpartition('/')[2]}",
                 choices=[
                     {"name": "⬇️ Download", "value": "download"},
                     {"name": "❌ Cancelar", "value": "cancel"},
@@ -253,7 +372,7 @@ def interactive_s3_browser(s3_client):
             ).execute()
             
             if action == "download":
-                download_file(s3_client, current_bucket, key)
+                download_file(s3_client, current_bucket, key, sizes[keys.index(key)])
 
 
 @app.callback(invoke_without_command=True)
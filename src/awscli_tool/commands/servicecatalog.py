@@ -1,62 +1,164 @@
 """Service Catalog commands - interactive wizard and direct commands."""
 
-from typing import Optional
+from concurrent.futures import Future, wait
+from functools import partial
+from typing import Iterator, Optional
 
 import typer
 from InquirerPy import inquirer
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from awscli_tool.config import select_profile, ensure_sso_login
 from awscli_tool.utils.aws_client import get_client
+from awscli_tool.utils.prefetch import background, prefetch
+from awscli_tool.utils.spinner import spinner
+from awscli_tool.utils.ttl_cache import ttl_cached
 
 console = Console()
 app = typer.Typer(no_args_is_help=False)
 
-
-def list_portfolios(sc_client) -> list[dict]:
-    """List all portfolios the user has access to."""
-    portfolios = []
+# Largest page each Service Catalog API accepts (the defaults are smaller)
+PORTFOLIOS_PAGE_SIZE = 20
+PAGE_SIZE = 100
+
+# Rows rendered per table before asking whether to show more
+TABLE_PAGE_SIZE = 50
+
+_STATUS_MARKUP = {
+    "AVAILABLE": "[green]● {s}[/green]",
+    "UNDER_CHANGE": "[yellow]◐ {s}[/yellow]",
+    "PLAN_IN_PROGRESS": "[yellow]◐ {s}[/yellow]",
+    "ERROR": "[red]● {s}[/red]",
+    "TAINTED": "[red]● {s}[/red]",
+}
+
+
+def _status_md(status: str) -> str:
+    """Rich markup for a provisioned product status."""
+    return _STATUS_MARKUP.get(status, "[dim]{s}[/dim]").format(s=status)
+
+
+# (our key, API key, default) for each AWS shape we flatten
+_PORTFOLIO_KEYS = (
+    ("id", "Id", None),
+    ("name", "DisplayName", None),
+    ("description", "Description", ""),
+    ("provider", "ProviderName", ""),
+)
+_PRODUCT_KEYS = (
+    ("id", "ProductId", None),
+    ("name", "Name", None),
+    ("description", "ShortDescription", ""),
+    ("type", "Type", ""),
+    ("owner", "Owner", ""),
+    ("view_id", "Id", ""),
+)
+_VERSION_KEYS = (
+    ("id", "Id", None),
+    ("name", "Name", None),
+    ("description", "Description", ""),
+    ("created", "CreatedTime", None),
+)
+_PATH_KEYS = (
+    ("id", "Id", None),
+    ("name", "Name", "Default"),
+    ("constraint_summaries", "ConstraintSummaries", ()),
+)
+_PROVISIONED_KEYS = (
+    ("id", "Id", None),
+    ("name", "Name", None),
+    ("status", "Status", None),
+    ("status_message", "StatusMessage", ""),
+    ("product_id", "ProductId", ""),
+    ("product_name", "ProductName", "N/A"),
+    ("created", "CreatedTime", None),
+    ("arn", "Arn", ""),
+)
+_PP_DETAIL_KEYS = (
+    ("id", "Id", ""),
+    ("name", "Name", ""),
+    ("status", "Status", ""),
+    ("status_message", "StatusMessage", ""),
+    ("arn", "Arn", ""),
+    ("type", "Type", ""),
+    ("product_id", "ProductId", ""),
+    ("provisioning_artifact_id", "ProvisioningArtifactId", ""),
+    ("launch_role_arn", "LaunchRoleArn", ""),
+    ("created", "CreatedTime", None),
+    ("last_record_id", "LastRecordId", ""),
+)
+
+
+def _rename(item: dict, keys: tuple) -> dict:
+    """Flatten an API item into our dict shape using a key table."""
+    return {dest: item.get(src, default) for dest, src, default in keys}
+
+
+def _iter_portfolios(sc_client) -> Iterator[dict]:
+    """Yield portfolios as the pages arrive."""
     paginator = sc_client.get_paginator("list_portfolios")
     
-    for page in paginator.paginate():
+    for page in paginator.paginate(PaginationConfig={"PageSize": PORTFOLIOS_PAGE_SIZE}):
         for portfolio in page.get("PortfolioDetails", []):
-            portfolios.append({
-                "id": portfolio["Id"],
-                "name": portfolio["DisplayName"],
-                "description": portfolio.get("Description", ""),
-                "provider": portfolio.get("ProviderName", ""),
-            })
+            yield _rename(portfolio, _PORTFOLIO_KEYS)
+
+
+@ttl_cached(60)
+def list_portfolios(sc_client) -> list[dict]:
+    """List all portfolios the user has access to."""
+    return list(_iter_portfolios(sc_client))
+
+
+def _product_label(product: dict) -> str:
+    """Menu label for a product: name plus a short description."""
+    if not product["description"]:
+        return product["name"]
+    return f"{product['name']} - {product['description'][:30]}..."
+
+
+def _iter_products(sc_client) -> Iterator[dict]:
+    """Yield products available to the user, sorted by title, as the pages arrive; API errors are raised."""
+    paginator = sc_client.get_paginator("search_products")
     
-    return portfolios
+    for page in paginator.paginate(
+        SortBy="Title",
+        SortOrder="ASCENDING",
+        PaginationConfig={"PageSize": PAGE_SIZE},
+    ):
+        for product_view in page.get("ProductViewSummaries", []):
+            product = _rename(product_view, _PRODUCT_KEYS)
+            product["label"] = _product_label(product)
+            yield product
+
 
+@ttl_cached(60)
+def _fetch_products(sc_client) -> list[dict]:
+    """All products available to the user; API errors are raised, not printed."""
+    # search_products already returns them sorted by title
+    return list(_iter_products(sc_client))
 
-def list_products(sc_client) -> list[dict]:
-    """List all products available to the user."""
-    products = []
+
+def list_products(sc_client, prefetched: Optional[Future] = None) -> list[dict]:
+    """
+    List all products available to the user, sorted by name.
     
+    `prefetched` is the matching future from prefetch_listings: it is waited
+    on so the listing comes from the cache it filled, and if it failed the
+    call is retried and reported here, on the calling thread.
+    """
+    if prefetched is not None:
+        wait([prefetched])
     try:
-        paginator = sc_client.get_paginator("search_products")
-        
-        for page in paginator.paginate():
-            for product_view in page.get("ProductViewSummaries", []):
-                products.append({
-                    "id": product_view["ProductId"],
-                    "name": product_view["Name"],
-                    "description": product_view.get("ShortDescription", ""),
-                    "type": product_view.get("Type", ""),
-                    "owner": product_view.get("Owner", ""),
-                    "view_id": product_view.get("Id", ""),
-                })
+        return _fetch_products(sc_client)
     except Exception as e:
         console.print(f"[red]Erro ao listar produtos: {e}[/red]")
-    
-    products.sort(key=lambda x: x["name"].lower())
-    return products
+        return []
 
 
+@ttl_cached(60)
 def get_product_versions(sc_client, product_id: str) -> list[dict]:
     """Get available versions (provisioning artifacts) for a product."""
     versions = []
@@ -66,18 +168,14 @@ def get_product_versions(sc_client, product_id: str) -> list[dict]:
         
         for artifact in response.get("ProvisioningArtifacts", []):
             if artifact.get("Guidance") != "DEPRECATED":
-                versions.append({
-                    "id": artifact["Id"],
-                    "name": artifact["Name"],
-                    "description": artifact.get("Description", ""),
-                    "created": artifact.get("CreatedTime"),
-                })
+                versions.append(_rename(artifact, _VERSION_KEYS))
     except Exception as e:
         console.print(f"[red]Erro ao obter versões: {e}[/red]")
     
     return versions
 
 
+@ttl_cached(60)
 def get_launch_paths(sc_client, product_id: str) -> list[dict]:
     """Get launch paths for a product."""
     paths = []
@@ -86,98 +184,189 @@ def get_launch_paths(sc_client, product_id: str) -> list[dict]:
         response = sc_client.list_launch_paths(ProductId=product_id)
         
         for path in response.get("LaunchPathSummaries", []):
-            paths.append({
-                "id": path["Id"],
-                "name": path.get("Name", "Default"),
-                "constraint_summaries": path.get("ConstraintSummaries", []),
-            })
+            paths.append(_rename(path, _PATH_KEYS))
     except Exception as e:
         console.print(f"[red]Erro ao obter launch paths: {e}[/red]")
     
     return paths
 
 
-def get_provisioning_parameters(sc_client, product_id: str, artifact_id: str, path_id: str = None) -> list[dict]:
-    """Get parameters required to provision a product."""
-    params = []
+def _describe_provisioning_parameters(sc_client, product_id: str, artifact_id: str, path_id: str = None) -> list[dict]:
+    """Describe the provisioning parameters; API errors are raised, not printed."""
+    kwargs = {
+        "ProductId": product_id,
+        "ProvisioningArtifactId": artifact_id,
+    }
+    if path_id:
+        kwargs["PathId"] = path_id
+    
+    response = sc_client.describe_provisioning_parameters(**kwargs)
+    
+    return [
+        {
+            "key": param["ParameterKey"],
+            "type": param.get("ParameterType", "String"),
+            "default": param.get("DefaultValue", ""),
+            "description": param.get("Description", ""),
+            "constraints": param.get("ParameterConstraints", {}),
+            "is_no_echo": param.get("IsNoEcho", False),
+        }
+        for param in response.get("ProvisioningArtifactParameters", [])
+    ]
+
+
+def get_provisioning_parameters(
+    sc_client, product_id: str, artifact_id: str, path_id: str = None,
+    prefetched: Optional[Future] = None,
+) -> list[dict]:
+    """
+    Get parameters required to provision a product.
     
+    `prefetched` is a future from prefetch_provisioning_parameters; a failure
+    in it is reported here, on the calling thread.
+    """
     try:
-        kwargs = {
-            "ProductId": product_id,
-            "ProvisioningArtifactId": artifact_id,
-        }
-        if path_id:
-            kwargs["PathId"] = path_id
-        
-        response = sc_client.describe_provisioning_parameters(**kwargs)
-        
-        for param in response.get("ProvisioningArtifactParameters", []):
-            params.append({
-                "key": param["ParameterKey"],
-                "type": param.get("ParameterType", "String"),
-                "default": param.get("DefaultValue", ""),
-                "description": param.get("Description", ""),
-                "constraints": param.get("ParameterConstraints", {}),
-                "is_no_echo": param.get("IsNoEcho", False),
-            })
+        if prefetched is not None:
+            return prefetched.result()
+        return _describe_provisioning_parameters(sc_client, product_id, artifact_id, path_id)
     except Exception as e:
         console.print(f"[red]Erro ao obter parâmetros: {e}[/red]")
+        return []
+
+
+def _iter_provisioned_products(sc_client) -> Iterator[dict]:
+    """Yield provisioned products as the pages arrive (unsorted); API errors are raised."""
+    paginator = sc_client.get_paginator("scan_provisioned_products")
     
-    return params
+    for page in paginator.paginate(
+        AccessLevelFilter={"Key": "Account", "Value": "self"},
+        PaginationConfig={"PageSize": PAGE_SIZE},
+    ):
+        for pp in page.get("ProvisionedProducts", []):
+            yield _rename(pp, _PROVISIONED_KEYS)
+
 
+@ttl_cached(60)
+def _fetch_provisioned_products(sc_client) -> list[dict]:
+    """All provisioned products, sorted by name; API errors are raised, not printed."""
+    return sorted(_iter_provisioned_products(sc_client), key=lambda x: x["name"].lower())
 
-def list_provisioned_products(sc_client) -> list[dict]:
-    """List all provisioned products."""
-    products = []
+
+def list_provisioned_products(sc_client, prefetched: Optional[Future] = None) -> list[dict]:
+    """
+    List all provisioned products, sorted by name.
     
+    `prefetched` works as in list_products.
+    """
+    if prefetched is not None:
+        wait([prefetched])
     try:
-        paginator = sc_client.get_paginator("scan_provisioned_products")
-        
-        for page in paginator.paginate(AccessLevelFilter={"Key": "Account", "Value": "self"}):
-            for pp in page.get("ProvisionedProducts", []):
-                products.append({
-                    "id": pp["Id"],
-                    "name": pp["Name"],
-                    "status": pp["Status"],
-                    "status_message": pp.get("StatusMessage", ""),
-                    "product_id": pp.get("ProductId", ""),
-                    "product_name": pp.get("ProductName", "N/A"),
-                    "created": pp.get("CreatedTime"),
-                    "arn": pp.get("Arn", ""),
-                })
+        return _fetch_provisioned_products(sc_client)
     except Exception as e:
         console.print(f"[red]Erro ao listar provisionados: {e}[/red]")
-    
-    products.sort(key=lambda x: x["name"].lower())
-    return products
+        return []
+
 
+def _describe_provisioned_product(sc_client, pp_id: str) -> dict:
+    """Describe a provisioned product; API errors are raised, not printed."""
+    response = sc_client.describe_provisioned_product(Id=pp_id)
+    return _rename(response.get("ProvisionedProductDetail", {}), _PP_DETAIL_KEYS)
 
-def get_provisioned_product_detail(sc_client, pp_id: str) -> dict:
-    """Get details of a provisioned product."""
+
+def get_provisioned_product_detail(sc_client, pp_id: str, prefetched: Optional[Future] = None) -> dict:
+    """
+    Get details of a provisioned product.
+    
+    `prefetched` is a future from prefetch_provisioned_details; a failure in
+    it is reported here, on the calling thread. If it is still queued behind
+    the other describes it is cancelled and the call made right away.
+    """
     try:
-        response = sc_client.describe_provisioned_product(Id=pp_id)
-        pp = response.get("ProvisionedProductDetail", {})
-        
-        return {
-            "id": pp.get("Id", ""),
-            "name": pp.get("Name", ""),
-            "status": pp.get("Status", ""),
-            "status_message": pp.get("StatusMessage", ""),
-            "arn": pp.get("Arn", ""),
-            "type": pp.get("Type", ""),
-            "product_id": pp.get("ProductId", ""),
-            "provisioning_artifact_id": pp.get("ProvisioningArtifactId", ""),
-            "launch_role_arn": pp.get("LaunchRoleArn", ""),
-            "created": pp.get("CreatedTime"),
-            "last_record_id": pp.get("LastRecordId", ""),
-        }
+        if prefetched is not None and not prefetched.cancel():
+            return prefetched.result()
+        return _describe_provisioned_product(sc_client, pp_id)
     except Exception as e:
         console.print(f"[red]Erro ao obter detalhes: {e}[/red]")
         return {}
 
 
-def display_products_table(products: list[dict]):
-    """Display products in a rich table."""
+def prefetch_listings(sc_client) -> dict[str, Future]:
+    """
+    Start loading the product and provisioned listings side by side.
+    
+    Both land in their TTL caches, so the first menu the user opens waits
+    for the slower of the two calls rather than their sum. Errors stay in
+    the futures; pass them to list_products / list_provisioned_products,
+    which report them.
+    """
+    return background({
+        "products": partial(_fetch_products, sc_client),
+        "provisioned": partial(_fetch_provisioned_products, sc_client),
+    })
+
+
+def prefetch_provisioned_details(sc_client, provisioned: list[dict]):
+    """
+    Context manager describing provisioned products while the user picks one.
+    
+    Only the products the picker shows before any typing (it is 70% of the
+    terminal tall) are described; the futures are keyed by id and meant for
+    get_provisioned_product_detail.
+    """
+    visible = max(1, console.size.height * 7 // 10)
+    return prefetch({
+        pp["id"]: partial(_describe_provisioned_product, sc_client, pp["id"])
+        for pp in provisioned[:visible]
+    })
+
+
+def prefetch_provisioning_parameters(
+    sc_client, product_id: str, versions: list[dict], path_id: Optional[str],
+):
+    """Context manager describing the parameters of `versions` (futures by artifact id)."""
+    return prefetch({
+        v["id"]: partial(_describe_provisioning_parameters, sc_client, product_id, v["id"], path_id)
+        for v in versions
+    })
+
+
+# kind -> (source list, choices built from it)
+_CHOICES_MEMO: dict[str, tuple[list, list]] = {}
+
+
+def _memo_choices(kind: str, items: list[dict], build) -> list[dict]:
+    """
+    Return build(items), reusing the last result for the same list object.
+    
+    The listings are TTL-cached, so reopening a menu within the TTL hands
+    back the very same list and its choices need not be rebuilt.
+    """
+    hit = _CHOICES_MEMO.get(kind)
+    if hit and hit[0] is items:
+        return hit[1]
+    choices = build(items)
+    _CHOICES_MEMO[kind] = (items, choices)
+    return choices
+
+
+def launch_choices(products: list[dict]) -> list[dict]:
+    """Menu choices for picking a product to provision."""
+    return _memo_choices("products", products, lambda items: [
+        *({"name": p["label"], "value": p} for p in items),
+        {"name": "◀️  Cancelar", "value": None},
+    ])
+
+
+def provisioned_choices(provisioned: list[dict]) -> list[dict]:
+    """Menu choices for picking a provisioned product."""
+    return _memo_choices("provisioned", provisioned, lambda items: [
+        *({"name": f"{pp['name']} ({pp['status']})", "value": pp} for pp in items),
+        {"name": "◀️  Voltar", "value": None},
+    ])
+
+
+def _products_table() -> Table:
+    """Create the empty products table."""
     table = Table(
         title="📦 Service Catalog Products",
         show_header=True,
@@ -187,51 +376,95 @@ def display_products_table(products: list[dict]):
     table.add_column("Product ID", style="dim")
     table.add_column("Type")
     table.add_column("Owner")
-    table.add_column("Description", max_width=40)
-    
-    for prod in products:
-        table.add_row(
-            prod["name"],
-            prod["id"],
-            prod["type"],
-            prod["owner"],
-            prod["description"][:40] + "..." if len(prod["description"]) > 40 else prod["description"],
-        )
+    table.add_column("Description", max_width=40, overflow="ellipsis", no_wrap=True)
+    return table
+
+
+def _add_product_row(table: Table, prod: dict):
+    """Append one product to the products table."""
+    table.add_row(
+        prod["name"],
+        prod["id"],
+        prod["type"],
+        prod["owner"],
+        prod["description"],
+    )
+
+
+def _print_paged(rows: list[dict], new_table, add_row, page_size: Optional[int], noun: str):
+    """Print rows in tables of `page_size`, asking before each further page."""
+    page_size = page_size or len(rows) or 1
+    
+    for start in range(0, len(rows), page_size):
+        table = new_table()
+        if start:
+            table.title = None
+        for row in rows[start:start + page_size]:
+            add_row(table, row)
+        console.print(table)
+        
+        remaining = len(rows) - start - page_size
+        if remaining <= 0:
+            break
+        show_more = inquirer.confirm(
+            message=f"Mostrar mais {min(remaining, page_size)} de {remaining} {noun} restantes?",
+            default=False,
+        ).execute()
+        if not show_more:
+            console.print(f"[dim]... mais {remaining} {noun} não exibidos[/dim]")
+            break
+
+
+def display_products_table(products: list[dict], page_size: Optional[int] = TABLE_PAGE_SIZE):
+    """Display products in a rich table, `page_size` rows at a time (None for all)."""
+    _print_paged(products, _products_table, _add_product_row, page_size, "produtos")
+
+
+def stream_products_table(products: Iterator[dict]) -> int:
+    """
+    Display products while they are still being fetched.
     
-    console.print(table)
+    Rows are added to a live table as each page arrives. Returns the
+    number of products shown.
+    """
+    table = _products_table()
+    count = 0
+    
+    with Live(table, console=console, refresh_per_second=8):
+        for prod in products:
+            _add_product_row(table, prod)
+            count += 1
+    
+    return count
 
 
-def display_provisioned_table(products: list[dict]):
-    """Display provisioned products in a rich table."""
+def _provisioned_table() -> Table:
+    """Create the empty provisioned products table."""
     table = Table(
         title="📋 Provisioned Products",
         show_header=True,
         header_style="bold cyan",
     )
     table.add_column("Name", style="cyan")
-    table.add_column("ID", style="dim")
+    table.add_column("ID", style="dim", max_width=15, overflow="ellipsis", no_wrap=True)
     table.add_column("Product")
     table.add_column("Status")
-    
-    for pp in products:
-        status = pp["status"]
-        if status == "AVAILABLE":
-            status_display = f"[green]● {status}[/green]"
-        elif status in ["UNDER_CHANGE", "PLAN_IN_PROGRESS"]:
-            status_display = f"[yellow]◐ {status}[/yellow]"
-        elif status in ["ERROR", "TAINTED"]:
-            status_display = f"[red]● {status}[/red]"
-        else:
-            status_display = f"[dim]{status}[/dim]"
-        
-        table.add_row(
-            pp["name"],
-            pp["id"][:12] + "...",
-            pp["product_name"],
-            status_display,
-        )
-    
-    console.print(table)
+    return table
+
+
+def _add_provisioned_row(table: Table, pp: dict):
+    """Append one provisioned product to the provisioned table."""
+    table.add_row(
+        pp["name"],
+        pp["id"],
+        pp["product_name"],
+        _status_md(pp["status"]),
+    )
+
+
+def display_provisioned_table(products: list[dict], page_size: Optional[int] = TABLE_PAGE_SIZE):
+    """Display provisioned products in a rich table, `page_size` rows at a time (None for all)."""
+    _print_paged(products, _provisioned_table, _add_provisioned_row, page_size, "provisionados")
 
 
 def provision_product_action(sc_client, product: dict):
@@ -239,61 +472,61 @@ def provision_product_action(sc_client, product: dict):
     console.print(f"\n[bold cyan]🚀 Provisionar: {product['name']}[/bold cyan]\n")
     
     # Get versions
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        progress.add_task("Carregando versões...", total=None)
-        versions = get_product_versions(sc_client, product["id"])
-        paths = get_launch_paths(sc_client, product["id"])
+    with spinner("Carregando versões..."):
+        with prefetch({
+            "versions": partial(get_product_versions, sc_client, product["id"]),
+            "paths": partial(get_launch_paths, sc_client, product["id"]),
+        }) as futures:
+            versions, paths = futures["versions"].result(), futures["paths"].result()
     
     if not versions:
         console.print("[red]❌ Nenhuma versão disponível para este produto[/red]")
         return
     
-    # Select version
-    version_choices = [
-        {"name": f"{v['name']} - {v['description']}", "value": v}
-        for v in versions
-    ]
-    version_choices.append({"name": "◀️  Cancelar", "value": None})
-    
-    selected_version = inquirer.select(
-        message="📌 Selecione a versão:",
-        choices=version_choices,
-    ).execute()
-    
-    if selected_version is None:
-        return
-    
-    # Select path if multiple
-    path_id = None
-    if len(paths) > 1:
-        path_choices = [
-            {"name": p["name"], "value": p["id"]}
-            for p in paths
+    # With at most one launch path the path is already known, so describe
+    # the parameters of every version while the user is choosing one
+    default_path_id = paths[0]["id"] if len(paths) == 1 else None
+    prefetch_versions = versions if len(paths) <= 1 else []
+    
+    with prefetch_provisioning_parameters(
+        sc_client, product["id"], prefetch_versions, default_path_id,
+    ) as params_futures:
+        # Select version
+        version_choices = [
+            {"name": f"{v['name']} - {v['description']}", "value": v}
+            for v in versions
         ]
-        path_id = inquirer.select(
-            message="🛤️  Selecione o launch path:",
-            choices=path_choices,
+        version_choices.append({"name": "◀️  Cancelar", "value": None})
+        
+        selected_version = inquirer.select(
+            message="📌 Selecione a versão:",
+            choices=version_choices,
         ).execute()
-    elif paths:
-        path_id = paths[0]["id"]
-    
-    # Get parameters
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        progress.add_task("Carregando parâmetros...", total=None)
-        params = get_provisioning_parameters(
-            sc_client,
-            product["id"],
-            selected_version["id"],
-            path_id,
-        )
+        
+        if selected_version is None:
+            return
+        
+        # Select path if multiple
+        path_id = default_path_id
+        if len(paths) > 1:
+            path_choices = [
+                {"name": p["name"], "value": p["id"]}
+                for p in paths
+            ]
+            path_id = inquirer.select(
+                message="🛤️  Selecione o launch path:",
+                choices=path_choices,
+            ).execute()
+        
+        # Get parameters
+        with spinner("Carregando parâmetros..."):
+            params = get_provisioning_parameters(
+                sc_client,
+                product["id"],
+                selected_version["id"],
+                path_id,
+                prefetched=params_futures.get(selected_version["id"]),
+            )
     
     # Collect parameter values
     param_values = []
@@ -354,13 +587,7 @@ def provision_product_action(sc_client, product: dict):
     
     # Provision
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Provisionando...", total=None)
-            
+        with spinner("Provisionando..."):
             kwargs = {
                 "ProductId": product["id"],
                 "ProvisioningArtifactId": selected_version["id"],
@@ -375,6 +602,7 @@ def provision_product_action(sc_client, product: dict):
             
             response = sc_client.provision_product(**kwargs)
         
+        _fetch_provisioned_products.invalidate(sc_client)
         record = response.get("RecordDetail", {})
         console.print(Panel(
             f"[green]✓ Provisionamento iniciado![/green]\n\n"
@@ -401,36 +629,26 @@ def terminate_product_action(sc_client, pp: dict):
         border_style="red",
     ))
     
-    confirm = inquirer.confirm(
-        message="Você TEM CERTEZA que deseja terminar?",
-        default=False,
+    # Typing the exact name is the confirmation; anything else cancels
+    confirm_name = inquirer.text(
+        message=f"Digite '{pp['name']}' para confirmar (Enter para cancelar):",
     ).execute()
     
-    if not confirm:
+    if not confirm_name:
         console.print("[dim]Operação cancelada.[/dim]")
         return
     
-    # Double confirmation
-    confirm_name = inquirer.text(
-        message=f"Digite '{pp['name']}' para confirmar:",
-    ).execute()
-    
     if confirm_name != pp['name']:
         console.print("[dim]Nome não confere. Operação cancelada.[/dim]")
         return
     
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Terminando...", total=None)
-            
+        with spinner("Terminando..."):
             response = sc_client.terminate_provisioned_product(
                 ProvisionedProductId=pp["id"],
             )
         
+        _fetch_provisioned_products.invalidate(sc_client)
         record = response.get("RecordDetail", {})
         console.print(f"[green]✓ Terminação iniciada![/green] Record ID: {record.get('RecordId', 'N/A')}")
         
@@ -438,32 +656,20 @@ def terminate_product_action(sc_client, pp: dict):
         console.print(f"[red]❌ Erro ao terminar: {e}[/red]")
 
 
-def interactive_provisioned_menu(sc_client, pp: dict):
+def interactive_provisioned_menu(sc_client, pp: dict, prefetched: Optional[Future] = None):
     """Interactive menu for a provisioned product."""
     while True:
-        # Refresh details
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Carregando detalhes...", total=None)
-            details = get_provisioned_product_detail(sc_client, pp["id"])
+        # Refresh details (the first pass reuses the prefetched describe, if any)
+        with spinner("Carregando detalhes..."):
+            details = get_provisioned_product_detail(sc_client, pp["id"], prefetched)
+            prefetched = None
         
         if not details:
             console.print("[red]❌ Não foi possível carregar detalhes[/red]")
             return "back"
         
         # Display info
-        status = details["status"]
-        if status == "AVAILABLE":
-            status_display = f"[green]● {status}[/green]"
-        elif status in ["UNDER_CHANGE", "PLAN_IN_PROGRESS"]:
-            status_display = f"[yellow]◐ {status}[/yellow]"
-        else:
-            status_display = f"[red]● {status}[/red]"
-        
-        info = f"""[bold]Status:[/bold] {status_display}
+        info = f"""[bold]Status:[/bold] {_status_md(details['status'])}
 [bold]ID:[/bold] {details['id']}
 [bold]ARN:[/bold] [dim]{details['arn']}[/dim]
 [bold]Tipo:[/bold] {details['type']}
@@ -524,6 +730,7 @@ def sc_wizard(
         raise typer.Exit(1)
     
     sc_client = get_client("servicecatalog", selected_profile)
+    listings = prefetch_listings(sc_client)
     
     while True:
         action = inquirer.select(
@@ -538,13 +745,8 @@ def sc_wizard(
         ).execute()
         
         if action == "products":
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Carregando produtos...", total=None)
-                products = list_products(sc_client)
+            with spinner("Carregando produtos..."):
+                products = list_products(sc_client, listings["products"])
             
             if products:
                 display_products_table(products)
@@ -554,13 +756,8 @@ def sc_wizard(
             inquirer.confirm(message="Pressione Enter para continuar...", default=True).execute()
             
         elif action == "provisioned":
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Carregando provisionados...", total=None)
-                provisioned = list_provisioned_products(sc_client)
+            with spinner("Carregando provisionados..."):
+                provisioned = list_provisioned_products(sc_client, listings["provisioned"])
             
             if not provisioned:
                 console.print("[yellow]⚠ Nenhum produto provisionado[/yellow]")
@@ -570,36 +767,32 @@ def sc_wizard(
             display_provisioned_table(provisioned)
             
             # Select provisioned product
-            pp_choices = [
-                {"name": f"{pp['name']} ({pp['status']})", "value": pp}
-                for pp in provisioned
-            ]
-            pp_choices.append({"name": "◀️  Voltar", "value": None})
+            pp_choices = provisioned_choices(provisioned)
             
-            selected_pp = inquirer.fuzzy(
-                message="📦 Selecione um produto provisionado:",
-                instruction="[Digite para filtrar]",
-                choices=pp_choices,
-                max_height="70%",
-                multiselect=False,
-            ).execute()
+            with prefetch_provisioned_details(sc_client, provisioned) as detail_futures:
+                selected_pp = inquirer.fuzzy(
+                    message="📦 Selecione um produto provisionado:",
+                    instruction="[Digite para filtrar]",
+                    choices=pp_choices,
+                    max_height="70%",
+                    multiselect=False,
+                ).execute()
+                
+                result = None
+                if selected_pp:
+                    result = interactive_provisioned_menu(
+                        sc_client, selected_pp, detail_futures.get(selected_pp["id"]),
+                    )
+                else:
+                    console.print("[yellow]⚠ Nenhum produto selecionado.[/yellow]")
             
-            if selected_pp:
-                result = interactive_provisioned_menu(sc_client, selected_pp)
-                if result == "exit":
-                    console.print("[dim]Até logo! 👋[/dim]")
-                    break
-            else:
-                console.print("[yellow]⚠ Nenhum produto selecionado.[/yellow]")
+            if result == "exit":
+                console.print("[dim]Até logo! 👋[/dim]")
+                break
             
         elif action == "launch":
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Carregando produtos...", total=None)
-                products = list_products(sc_client)
+            with spinner("Carregando produtos..."):
+                products = list_products(sc_client, listings["products"])
             
             if not products:
                 console.print("[yellow]⚠ Nenhum produto disponível para provisionar[/yellow]")
@@ -607,15 +800,14 @@ def sc_wizard(
             
             display_products_table(products)
             
-            product_choices = [
-                {"name": f"{p['name']} - {p['description'][:30]}...", "value": p}
-                for p in products
-            ]
-            product_choices.append({"name": "◀️  Cancelar", "value": None})
+            product_choices = launch_choices(products)
             
-            selected_product = inquirer.select(
+            selected_product = inquirer.fuzzy(
                 message="🚀 Selecione o produto para provisionar:",
+                instruction="[Digite para filtrar]",
                 choices=product_choices,
+                max_height="70%",
+                multiselect=False,
             ).execute()
             
             if selected_product:
@@ -643,17 +835,14 @@ def list_products_cmd(
     
     sc_client = get_client("servicecatalog", selected_profile)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        progress.add_task("Carregando produtos...", total=None)
-        products = list_products(sc_client)
+    # One-shot command: show rows as pages arrive instead of waiting for all of them
+    try:
+        shown = stream_products_table(_iter_products(sc_client))
+    except Exception as e:
+        console.print(f"[red]Erro ao listar produtos: {e}[/red]")
+        raise typer.Exit(1)
     
-    if products:
-        display_products_table(products)
-    else:
+    if not shown:
         console.print("[yellow]⚠ Nenhum produto encontrado[/yellow]")
 
 
@@ -671,16 +860,11 @@ def list_provisioned_cmd(
     
     sc_client = get_client("servicecatalog", selected_profile)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        progress.add_task("Carregando provisionados...", total=None)
+    with spinner("Carregando provisionados..."):
         provisioned = list_provisioned_products(sc_client)
     
     if provisioned:
-        display_provisioned_table(provisioned)
+        display_provisioned_table(provisioned, page_size=None)
     else:
         console.print("[yellow]⚠ Nenhum produto provisionado[/yellow]")
 
@@ -700,28 +884,15 @@ def status_cmd(
     
     sc_client = get_client("servicecatalog", selected_profile)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        progress.add_task("Carregando detalhes...", total=None)
+    with spinner("Carregando detalhes..."):
         details = get_provisioned_product_detail(sc_client, pp_id)
     
     if not details:
         console.print("[red]❌ Produto não encontrado[/red]")
         raise typer.Exit(1)
     
-    status = details["status"]
-    if status == "AVAILABLE":
-        status_display = f"[green]● {status}[/green]"
-    elif status in ["UNDER_CHANGE", "PLAN_IN_PROGRESS"]:
-        status_display = f"[yellow]◐ {status}[/yellow]"
-    else:
-        status_display = f"[red]● {status}[/red]"
-    
     info = f"""[bold]Nome:[/bold] {details['name']}
-[bold]Status:[/bold] {status_display}
+[bold]Status:[/bold] {_status_md(details['status'])}
 [bold]ID:[/bold] {details['id']}
 [bold]Tipo:[/bold] {details['type']}
 [bold]ARN:[/bold] [dim]{details['arn']}[/dim]
@@ -1,54 +1,160 @@
 """AWS SSO profile configuration and selection."""
 
-import configparser
+import hashlib
+import json
+import os
 import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from InquirerPy import inquirer
 from rich.console import Console
 
+from awscli_tool.utils.aws_client import get_client, reset_clients
+
 console = Console()
 
 
+@dataclass(frozen=True, slots=True)
+class SsoProfile:
+    """An SSO profile from ~/.aws/config."""
+    
+    name: str
+    region: str
+    account_id: str
+    role: str
+    start_url: Optional[str] = None
+    sso_session: Optional[str] = None
+
+
+# ((st_mtime_ns, st_size), profiles) of the last parsed config file
+_PROFILE_CACHE: Optional[tuple[tuple[int, int], tuple[SsoProfile, ...]]] = None
+
+# The only profile keys get_sso_profiles looks at
+_PROFILE_KEYS = frozenset({"region", "sso_account_id", "sso_role_name", "sso_start_url", "sso_session"})
+
+
 def get_aws_config_path() -> Path:
     """Get the path to AWS config file."""
     return Path.home() / ".aws" / "config"
 
 
-def get_sso_profiles() -> list[dict]:
+def _parse_profile_sections(text: str) -> list[tuple[str, dict]]:
+    """
+    Scan an AWS config file for `[profile ...]` sections in one pass.
+    
+    Keeps only the keys in _PROFILE_KEYS; as with configparser, values from
+    `[DEFAULT]` fill in keys a profile does not set, and text after a
+    header's `]` (such as a comment) is ignored. Comments, other sections
+    and indented lines are skipped (configparser would append indented lines
+    to the previous value, which none of the kept keys use).
+    """
+    sections = []
+    defaults = {}
+    data = None
+    
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line[0] in "#;" or raw[0] in " \t":
+            continue
+        
+        end = line.find("]")
+        if line[0] == "[" and end > 1:
+            name = line[1:end]
+            data = None
+            if name == "DEFAULT":
+                data = defaults
+            elif name.startswith("profile "):
+                data = {}
+                sections.append((name[len("profile "):], data))
+            continue
+        
+        if data is None:
+            continue
+        
+        # Like configparser, the first '=' or ':' separates key and value
+        key, sep, value = line.partition("=")
+        if ":" in key:
+            key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = key.strip().lower()
+        if key in _PROFILE_KEYS:
+            data[key] = value.strip()
+    
+    return [(name, {**defaults, **data}) for name, data in sections]
+
+
+def _read_file(path: Path, size: int) -> bytes:
+    """Read a small file with raw os.read calls, skipping the text I/O stack."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, max(size, 4096)):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def get_sso_profiles() -> list[SsoProfile]:
     """
     Read SSO profiles from AWS config file.
     
-    Returns a list of dicts with profile info.
+    Returns a list of (frozen) SsoProfile records.
     """
+    global _PROFILE_CACHE
+    
     config_path = get_aws_config_path()
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         console.print("[red]❌ Arquivo ~/.aws/config não encontrado![/red]")
         console.print("Execute 'aws configure sso' para configurar seus profiles.")
         return []
     
-    config = configparser.ConfigParser()
-    config.read(config_path)
+    # Reuse the last parse while the file is unchanged
+    key = (st.st_mtime_ns, st.st_size)
+    if _PROFILE_CACHE and _PROFILE_CACHE[0] == key:
+        return list(_PROFILE_CACHE[1])
+    
+    text = _read_file(config_path, st.st_size).decode("utf-8")
     
     profiles = []
-    for section in config.sections():
-        if section.startswith("profile "):
-            profile_name = section.replace("profile ", "")
-            profile_data = dict(config[section])
-            
-            # Check if it's an SSO profile
-            if "sso_start_url" in profile_data or "sso_session" in profile_data:
-                profiles.append({
-                    "name": profile_name,
-                    "region": profile_data.get("region", "N/A"),
-                    "account_id": profile_data.get("sso_account_id", "N/A"),
-                    "role": profile_data.get("sso_role_name", "N/A"),
-                })
+    for profile_name, profile_data in _parse_profile_sections(text):
+        # Check if it's an SSO profile
+        if "sso_start_url" in profile_data or "sso_session" in profile_data:
+            profiles.append(SsoProfile(
+                name=profile_name,
+                region=profile_data.get("region", "N/A"),
+                account_id=profile_data.get("sso_account_id", "N/A"),
+                role=profile_data.get("sso_role_name", "N/A"),
+                start_url=profile_data.get("sso_start_url"),
+                sso_session=profile_data.get("sso_session"),
+            ))
     
+    _PROFILE_CACHE = (key, tuple(profiles))
     return profiles
 
 
+def invalidate_profile_cache():
+    """Forget the cached profiles so the next read parses the file again."""
+    global _PROFILE_CACHE
+    _PROFILE_CACHE = None
+
+
+@lru_cache(maxsize=4)
+def _profile_choices(profiles: tuple[SsoProfile, ...]) -> list[dict]:
+    """Menu choices with profile info, built once per distinct set of profiles."""
+    return [
+        {"name": f"{p.name} ({p.region} - {p.account_id})", "value": p.name}
+        for p in profiles
+    ]
+
+
 def select_profile(profile_name: Optional[str] = None) -> Optional[str]:
     """
     Interactive profile selector.
@@ -63,19 +169,14 @@ def select_profile(profile_name: Optional[str] = None) -> Optional[str]:
     
     # If profile specified, validate it
     if profile_name:
-        profile_names = [p["name"] for p in profiles]
-        if profile_name in profile_names:
+        if any(p.name == profile_name for p in profiles):
             return profile_name
         else:
             console.print(f"[red]❌ Profile '{profile_name}' não encontrado![/red]")
-            console.print(f"Profiles disponíveis: {', '.join(profile_names)}")
+            console.print(f"Profiles disponíveis: {', '.join(p.name for p in profiles)}")
             return None
     
-    # Build choices with profile info
-    choices = []
-    for p in profiles:
-        label = f"{p['name']} ({p['region']} - {p['account_id']})"
-        choices.append({"name": label, "value": p["name"]})
+    choices = _profile_choices(tuple(profiles))
     
     # Interactive selection
     selected = inquirer.select(
@@ -87,6 +188,56 @@ def select_profile(profile_name: Optional[str] = None) -> Optional[str]:
     return selected
 
 
+def _sso_token_path(profile: SsoProfile) -> Optional[Path]:
+    """Token cache file the AWS CLI writes on `aws sso login` for the profile."""
+    # Named after the SHA1 of the sso-session name, or of the start URL for
+    # legacy profiles without one
+    key = profile.sso_session or profile.start_url
+    if not key:
+        return None
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return Path.home() / ".aws" / "sso" / "cache" / f"{digest}.json"
+
+
+def _has_cached_token(profile_name: str) -> bool:
+    """
+    Check the cached SSO token's expiresAt without any AWS call.
+    
+    Uses the profiles already parsed by get_sso_profiles; a token expiring
+    within the next minute counts as expired.
+    """
+    profiles = _PROFILE_CACHE[1] if _PROFILE_CACHE else ()
+    profile = next((p for p in profiles if p.name == profile_name), None)
+    path = _sso_token_path(profile) if profile else None
+    if path is None:
+        return False
+    
+    try:
+        st = path.stat()
+        token = json.loads(_read_file(path, st.st_size))
+        # Older CLI versions write "...UTC" instead of "...Z"
+        expires_at = token["expiresAt"].replace("UTC", "+00:00").replace("Z", "+00:00")
+        expires = datetime.fromisoformat(expires_at)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return False
+    
+    if expires.tzinfo is None:
+        expires = expires.replace(tzinfo=timezone.utc)
+    return expires > datetime.now(timezone.utc) + timedelta(minutes=1)
+
+
+def _has_valid_session(profile: str) -> bool:
+    """Check the profile's credentials with an in-process STS call."""
+    from botocore.exceptions import BotoCoreError, ClientError
+    
+    try:
+        get_client("sts", profile).get_caller_identity()
+        return True
+    except (BotoCoreError, ClientError):
+        # Expired/missing SSO token, unknown profile, network failure...
+        return False
+
+
 def ensure_sso_login(profile: str) -> bool:
     """
     Ensure SSO session is active for the profile.
@@ -95,14 +246,7 @@ def ensure_sso_login(profile: str) -> bool:
     """
     console.print(f"[dim]Verificando sessão SSO para profile '{profile}'...[/dim]")
     
-    # Try to get caller identity to check if session is valid
-    result = subprocess.run(
-        ["aws", "sts", "get-caller-identity", "--profile", profile],
-        capture_output=True,
-        text=True,
-    )
-    
-    if result.returncode == 0:
+    if _has_cached_token(profile) or _has_valid_session(profile):
         console.print(f"[green]✓ Sessão SSO válida para '{profile}'[/green]")
         return True
     
@@ -115,6 +259,8 @@ def ensure_sso_login(profile: str) -> bool:
     )
     
     if login_result.returncode == 0:
+        # Drop sessions/clients built before the login so they pick up the new token
+        reset_clients()
         console.print(f"[green]✓ Login SSO realizado com sucesso![/green]")
         return True
     else:
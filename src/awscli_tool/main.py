@@ -1,14 +1,17 @@
 """Main CLI entry point."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
 
 import typer
 from InquirerPy import inquirer
+from InquirerPy.base.control import Choice
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from awscli_tool.config import get_sso_profiles, select_profile, ensure_sso_login
+from awscli_tool.config import SsoProfile, get_sso_profiles, select_profile, ensure_sso_login
+from awscli_tool.utils.aws_client import prewarm, reset_clients
 
 console = Console()
 
@@ -20,58 +23,85 @@ app = typer.Typer(
 )
 
 
+@lru_cache(maxsize=4)
+def _profiles_table(profiles: tuple[SsoProfile, ...]) -> Table:
+    """Build the profiles table once per distinct set of profiles."""
+    table = Table(title="🔐 AWS SSO Profiles", header_style="bold cyan")
+    table.add_column("Profile", style="cyan")
+    table.add_column("Region")
+    table.add_column("Account ID", style="dim")
+    table.add_column("Role", style="green")
+    
+    for p in profiles:
+        table.add_row(p.name, p.region, p.account_id, p.role)
+    
+    return table
+
+
+def _render_profiles_table(profiles: list[SsoProfile]) -> Table:
+    """Table of SSO profiles, reused while the profiles are unchanged."""
+    return _profiles_table(tuple(profiles))
+
+
+def _select_from_values(
+    message: str,
+    values: Iterable[Any],
+    label: Optional[Callable[[Any], str]] = None,
+    back: Optional[str] = None,
+) -> Any:
+    """
+    Select one of `values`; returns None when the `back` entry is picked.
+    
+    Without `label` the values are their own names and go to InquirerPy
+    as-is; with it they are wrapped in Choice objects.
+    """
+    if label is None:
+        choices = list(values)
+    else:
+        choices = [Choice(value, name=label(value)) for value in values]
+    if back:
+        choices.append(Choice(None, name=back))
+    
+    return inquirer.select(message=message, choices=choices).execute()
+
+
 def run_ecs_wizard(profile: str):
     """Run the ECS interactive wizard."""
-    from awscli_tool.commands.ecs import list_clusters, list_services, get_service_details, get_tasks, interactive_menu
-    from awscli_tool.utils.aws_client import get_client
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from awscli_tool.commands.ecs import list_clusters, prefetch_services, services_of, interactive_menu
+    from awscli_tool.utils.aws_client import get_clients
+    from awscli_tool.utils.spinner import spinner
     
-    ecs_client = get_client("ecs", profile)
-    logs_client = get_client("logs", profile)
+    clients = get_clients(["ecs", "logs"], profile)
+    ecs_client, logs_client = clients["ecs"], clients["logs"]
     
     while True:
         # Select cluster
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Carregando clusters...", total=None)
+        with spinner("Carregando clusters..."):
             clusters = list_clusters(ecs_client)
         
         if not clusters:
             console.print("[red]❌ Nenhum cluster encontrado![/red]")
             return
         
-        cluster_choices = clusters + ["◀️  Voltar ao menu principal"]
-        cluster = inquirer.select(
-            message="📦 Selecione o cluster:",
-            choices=cluster_choices,
-        ).execute()
-        
-        if cluster == "◀️  Voltar ao menu principal":
-            return
-        
-        # Select service
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Carregando services...", total=None)
-            services = list_services(ecs_client, cluster)
+        with prefetch_services(ecs_client, clusters) as service_futures:
+            cluster = _select_from_values(
+                "📦 Selecione o cluster:", clusters, back="◀️  Voltar ao menu principal"
+            )
+            
+            if cluster is None:
+                return
+            
+            # Select service
+            with spinner("Carregando services..."):
+                services = services_of(ecs_client, cluster, service_futures)
         
         if not services:
             console.print(f"[yellow]⚠ Nenhum service encontrado no cluster {cluster}[/yellow]")
             continue
         
-        service_choices = services + ["◀️  Voltar"]
-        service = inquirer.select(
-            message="🔧 Selecione o service:",
-            choices=service_choices,
-        ).execute()
+        service = _select_from_values("🔧 Selecione o service:", services, back="◀️  Voltar")
         
-        if service == "◀️  Voltar":
+        if service is None:
             continue
         
         # Show interactive menu
@@ -85,7 +115,7 @@ def run_ec2_wizard(profile: str):
     """Run the EC2 interactive wizard."""
     from awscli_tool.commands.ec2 import list_instances, display_instances_table, get_instance_details, interactive_menu
     from awscli_tool.utils.aws_client import get_client
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from awscli_tool.utils.spinner import spinner
     
     ec2_client = get_client("ec2", profile)
     
@@ -105,12 +135,7 @@ def run_ec2_wizard(profile: str):
             return
         
         # List instances
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Carregando instâncias...", total=None)
+        with spinner("Carregando instâncias..."):
             instances = list_instances(ec2_client, filter_choice)
         
         if not instances:
@@ -121,16 +146,12 @@ def run_ec2_wizard(profile: str):
         display_instances_table(instances)
         
         # Select instance
-        instance_choices = [
-            {"name": f"{inst['name']} ({inst['id']}) - {inst['state']}", "value": inst}
-            for inst in instances
-        ]
-        instance_choices.append({"name": "◀️  Voltar", "value": None})
-        
-        selected = inquirer.select(
-            message="🖥️  Selecione uma instância:",
-            choices=instance_choices,
-        ).execute()
+        selected = _select_from_values(
+            "🖥️  Selecione uma instância:",
+            instances,
+            label=lambda inst: f"{inst['name']} ({inst['id']}) - {inst['state']}",
+            back="◀️  Voltar",
+        )
         
         if selected is None:
             continue
@@ -146,12 +167,14 @@ def run_servicecatalog_wizard(profile: str):
     """Run the Service Catalog interactive wizard."""
     from awscli_tool.commands.servicecatalog import (
         list_products, list_provisioned_products, display_products_table,
-        display_provisioned_table, provision_product_action, interactive_provisioned_menu
+        display_provisioned_table, provision_product_action, interactive_provisioned_menu,
+        launch_choices, provisioned_choices, prefetch_listings, prefetch_provisioned_details,
     )
     from awscli_tool.utils.aws_client import get_client
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from awscli_tool.utils.spinner import spinner
     
     sc_client = get_client("servicecatalog", profile)
+    listings = prefetch_listings(sc_client)
     
     while True:
         action = inquirer.select(
@@ -165,13 +188,8 @@ def run_servicecatalog_wizard(profile: str):
         ).execute()
         
         if action == "products":
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Carregando produtos...", total=None)
-                products = list_products(sc_client)
+            with spinner("Carregando produtos..."):
+                products = list_products(sc_client, listings["products"])
             
             if products:
                 display_products_table(products)
@@ -181,13 +199,8 @@ def run_servicecatalog_wizard(profile: str):
             inquirer.confirm(message="Pressione Enter para continuar...", default=True).execute()
             
         elif action == "provisioned":
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Carregando provisionados...", total=None)
-                provisioned = list_provisioned_products(sc_client)
+            with spinner("Carregando provisionados..."):
+                provisioned = list_provisioned_products(sc_client, listings["provisioned"])
             
             if not provisioned:
                 console.print("[yellow]⚠ Nenhum produto provisionado[/yellow]")
@@ -196,30 +209,26 @@ def run_servicecatalog_wizard(profile: str):
             
             display_provisioned_table(provisioned)
             
-            pp_choices = [
-                {"name": f"{pp['name']} ({pp['status']})", "value": pp}
-                for pp in provisioned
-            ]
-            pp_choices.append({"name": "◀️  Voltar", "value": None})
+            pp_choices = provisioned_choices(provisioned)
             
-            selected_pp = inquirer.select(
-                message="📦 Selecione um produto:",
-                choices=pp_choices,
-            ).execute()
+            with prefetch_provisioned_details(sc_client, provisioned) as detail_futures:
+                selected_pp = inquirer.select(
+                    message="📦 Selecione um produto:",
+                    choices=pp_choices,
+                ).execute()
+                
+                result = None
+                if selected_pp:
+                    result = interactive_provisioned_menu(
+                        sc_client, selected_pp, detail_futures.get(selected_pp["id"]),
+                    )
             
-            if selected_pp:
-                result = interactive_provisioned_menu(sc_client, selected_pp)
-                if result == "exit":
-                    return "exit"
+            if result == "exit":
+                return "exit"
             
         elif action == "launch":
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Carregando produtos...", total=None)
-                products = list_products(sc_client)
+            with spinner("Carregando produtos..."):
+                products = list_products(sc_client, listings["products"])
             
             if not products:
                 console.print("[yellow]⚠ Nenhum produto disponível[/yellow]")
@@ -227,15 +236,14 @@ def run_servicecatalog_wizard(profile: str):
             
             display_products_table(products)
             
-            product_choices = [
-                {"name": f"{p['name']}", "value": p}
-                for p in products
-            ]
-            product_choices.append({"name": "◀️  Cancelar", "value": None})
+            product_choices = launch_choices(products)
             
-            selected_product = inquirer.select(
+            selected_product = inquirer.fuzzy(
                 message="🚀 Selecione o produto:",
+                instruction="[Digite para filtrar]",
                 choices=product_choices,
+                max_height="70%",
+                multiselect=False,
             ).execute()
             
             if selected_product:
@@ -250,18 +258,13 @@ def run_apigw_wizard(profile: str):
     """Run the API Gateway interactive wizard."""
     from awscli_tool.commands.apigateway import list_apis, list_routes, select_api
     from awscli_tool.utils.aws_client import get_client
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from awscli_tool.utils.spinner import spinner
     
     apigw_client = get_client("apigatewayv2", profile)
     
     while True:
         # Load APIs
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Carregando APIs...", total=None)
+        with spinner("Carregando APIs..."):
             apis = list_apis(apigw_client)
         
         if not apis:
@@ -269,16 +272,12 @@ def run_apigw_wizard(profile: str):
             return
         
         # Select API
-        api_choices = [
-            {"name": f"{api['Name']} ({api['ApiId']})", "value": api}
-            for api in apis
-        ]
-        api_choices.append({"name": "◀️  Voltar ao menu principal", "value": None})
-        
-        api = inquirer.select(
-            message="🌐 Selecione a API:",
-            choices=api_choices,
-        ).execute()
+        api = _select_from_values(
+            "🌐 Selecione a API:",
+            apis,
+            label=lambda api: f"{api['Name']} ({api['ApiId']})",
+            back="◀️  Voltar ao menu principal",
+        )
         
         if api is None:
             return
@@ -367,14 +366,10 @@ def run_apigw_wizard(profile: str):
 def run_cost_wizard(profile: str):
     """Run the Cost & FinOps interactive wizard."""
     from awscli_tool.commands.cost import interactive_cost_menu
-    from awscli_tool.utils.aws_client import get_client
-    
-    ce_client = get_client("ce", profile)
-    ec2_client = get_client("ec2", profile)
-    rds_client = get_client("rds", profile)
-    elbv2_client = get_client("elbv2", profile)
+    from awscli_tool.utils.aws_client import get_clients
     
-    interactive_cost_menu(ce_client, ec2_client, rds_client, elbv2_client)
+    clients = get_clients(["ce", "ec2", "rds", "elbv2"], profile)
+    interactive_cost_menu(clients["ce"], clients["ec2"], clients["rds"], clients["elbv2"])
 
 
 def run_s3_wizard(profile: str):
@@ -408,6 +403,9 @@ def main(
         border_style="cyan",
     ))
     
+    # Load boto3 in the background while the user picks a profile
+    prewarm()
+    
     # Select profile
     selected_profile = select_profile(profile)
     if not selected_profile:
@@ -467,21 +465,14 @@ def main(
                 break
                 
         elif action == "profiles":
-            profiles = get_sso_profiles()
-            table = Table(title="🔐 AWS SSO Profiles", header_style="bold cyan")
-            table.add_column("Profile", style="cyan")
-            table.add_column("Region")
-            table.add_column("Account ID", style="dim")
-            table.add_column("Role", style="green")
-            
-            for p in profiles:
-                table.add_row(p["name"], p["region"], p["account_id"], p["role"])
-            
-            console.print(table)
+            console.print(_render_profiles_table(get_sso_profiles()))
             inquirer.confirm(message="Pressione Enter para continuar...", default=True).execute()
             
         elif action == "switch":
             new_profile = select_profile()
+            if new_profile and new_profile != selected_profile:
+                # The old profile's clients (and connection pools) are no longer needed
+                reset_clients()
             if new_profile and ensure_sso_login(new_profile):
                 selected_profile = new_profile
                 console.print(f"\n[green]✓ Trocado para:[/green] [cyan]{selected_profile}[/cyan]\n")
@@ -514,16 +505,7 @@ def list_profiles():
         console.print("[yellow]⚠ Nenhum profile SSO encontrado![/yellow]")
         return
     
-    table = Table(title="🔐 AWS SSO Profiles", header_style="bold cyan")
-    table.add_column("Profile", style="cyan")
-    table.add_column("Region")
-    table.add_column("Account ID", style="dim")
-    table.add_column("Role", style="green")
-    
-    for p in profiles:
-        table.add_row(p["name"], p["region"], p["account_id"], p["role"])
-    
-    console.print(table)
+    console.print(_render_profiles_table(profiles))
 
 
 if __name__ == "__main__":
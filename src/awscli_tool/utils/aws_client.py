@@ -1,25 +1,127 @@
 """AWS client factory with profile support."""
 
+import json
+import os
+import threading
 from functools import lru_cache
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import boto3
-from botocore.config import Config
 from rich.console import Console
 
+from awscli_tool.utils.ttl_cache import invalidate_all
+
+# boto3/botocore take ~100 ms to import, so they are only loaded once a
+# client or session is actually needed (not for --help or `profiles`)
+if TYPE_CHECKING:
+    import boto3
+
 console = Console()
 
 
+class _FastJSON:
+    """Stand-in for the json module that decodes with orjson."""
+    
+    def __init__(self, loads):
+        self.loads = loads
+    
+    def __getattr__(self, name):
+        return getattr(json, name)
+
+
+def _use_fast_json():
+    """Let botocore decode JSON responses with orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return
+    import botocore.parsers
+    
+    if not isinstance(botocore.parsers.json, _FastJSON):
+        botocore.parsers.json = _FastJSON(orjson.loads)
+
+
+# Per-service Config arguments merged over the default client config
+SERVICE_CONFIGS = {
+    # The Service Catalog wizard fans describe calls out over thread pools
+    "servicecatalog": {
+        "max_pool_connections": 32,
+        "retries": {"max_attempts": 10, "mode": "adaptive"},
+        "tcp_keepalive": True,
+    },
+    # One pooled connection per S3 transfer thread (see s3.transfer_config)
+    "s3": {
+        "max_pool_connections": 20,
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _client_config(service: str) -> Any:
+    """Build the botocore Config for `service` once (botocore is imported lazily)."""
+    from botocore.config import Config
+    
+    config = Config(
+        retries={"max_attempts": 3, "mode": "standard"},
+        connect_timeout=10,
+        read_timeout=30,
+    )
+    if service in SERVICE_CONFIGS:
+        config = config.merge(Config(**SERVICE_CONFIGS[service]))
+    return config
+
+
+_LOADER = None
+_LOADER_LOCK = threading.Lock()
+
+
+def _shared_loader() -> Any:
+    """
+    Return the botocore data loader shared by every session.
+    
+    The loader caches the models it parses, so sharing it means each model
+    is parsed once per process (by prewarm, if it gets there first) rather
+    than once per profile.
+    """
+    global _LOADER
+    
+    with _LOADER_LOCK:
+        if _LOADER is None:
+            import boto3
+            import botocore.session
+            
+            loader = botocore.session.get_session().get_component("data_loader")
+            loader.search_paths.append(os.path.join(os.path.dirname(boto3.__file__), "data"))
+            _LOADER = loader
+        return _LOADER
+
+
 @lru_cache(maxsize=10)
-def get_session(profile: str) -> boto3.Session:
+def get_session(profile: str) -> "boto3.Session":
     """Get or create a boto3 session for the given profile."""
-    return boto3.Session(profile_name=profile)
+    import boto3
+    import botocore.session
+    
+    _use_fast_json()
+    loader = _shared_loader()
+    
+    core = botocore.session.get_session()
+    core.register_component("data_loader", loader)
+    session = boto3.Session(botocore_session=core, profile_name=profile)
+    
+    # boto3 appends its data path to the loader for every session; keep one copy
+    if loader.search_paths.count(loader.search_paths[-1]) > 1:
+        loader.search_paths.pop()
+    return session
 
 
+@lru_cache(maxsize=64)
 def get_client(service: str, profile: str, region: str | None = None) -> Any:
     """
     Get a boto3 client for the specified service.
     
+    Clients are cached per (service, profile, region), so the service model
+    is only loaded once per session.
+    
     Args:
         service: AWS service name (e.g., 'ecs', 'apigateway', 'logs')
         profile: AWS profile name
@@ -30,19 +132,56 @@ def get_client(service: str, profile: str, region: str | None = None) -> Any:
     """
     session = get_session(profile)
     
-    config = Config(
-        retries={"max_attempts": 3, "mode": "standard"},
-        connect_timeout=10,
-        read_timeout=30,
-    )
-    
-    kwargs = {"config": config}
+    kwargs = {"config": _client_config(service)}
     if region:
         kwargs["region_name"] = region
     
     return session.client(service, **kwargs)
 
 
+def reset_clients():
+    """Drop every cached session and client (e.g. after an SSO login or profile switch)."""
+    get_client.cache_clear()
+    get_session.cache_clear()
+    # Cached listings are keyed by client and would keep the old ones alive
+    invalidate_all()
+
+
+def get_clients(services: list[str], profile: str, region: str | None = None) -> dict[str, Any]:
+    """
+    Get several boto3 clients at once, keyed by service name.
+    
+    Clients are built one after the other: model loading is GIL-bound JSON
+    parsing, so a thread pool measured no faster, and creating clients
+    from one session concurrently is not thread-safe.
+    """
+    return {service: get_client(service, profile, region) for service in services}
+
+
+# Services the interactive wizards touch first
+PREWARM_SERVICES = ("sts", "ecs", "ec2", "logs", "servicecatalog", "apigatewayv2")
+
+
+def prewarm(services: tuple[str, ...] = PREWARM_SERVICES):
+    """
+    Import boto3 and parse the common service models in a daemon thread.
+    
+    Meant to overlap with human think time (e.g. the profile prompt). The
+    models land in the loader every session shares (see _shared_loader), so
+    the first client of each service skips the parse.
+    """
+    def _run():
+        try:
+            loader = _shared_loader()
+            for service in services:
+                loader.load_service_model(service, "service-2")
+        except Exception:
+            # Best effort: the real call reports any problem
+            pass
+    
+    threading.Thread(target=_run, name="aws-prewarm", daemon=True).start()
+
+
 def get_resource(service: str, profile: str, region: str | None = None) -> Any:
     """
     Get a boto3 resource for the specified service.
@@ -1,9 +1,11 @@
 """Log formatting utilities for structured log display."""
 
 import json
+import math
 import re
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -11,6 +13,11 @@ from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
+try:
+    import orjson  # optional, see the `fast` extra
+except ImportError:
+    orjson = None
+
 console = Console()
 
 
@@ -24,28 +31,52 @@ LEVEL_COLORS = {
     "TRACE": "dim italic",
 }
 
-# Common patterns for log level extraction
+# Common patterns for log level extraction, tried in order. Each starts
+# with a literal, so re can skip ahead to candidate positions quickly.
 LEVEL_PATTERNS = [
-    r'"level"\s*:\s*"(\w+)"',
-    r'"severity"\s*:\s*"(\w+)"',
-    r'\[(\w+)\]',
-    r'\b(ERROR|WARN|WARNING|INFO|DEBUG|TRACE)\b',
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'"level"\s*:\s*"(\w+)"',
+        r'"severity"\s*:\s*"(\w+)"',
+        r'\[(\w+)\]',
+    )
 ]
 
+# Bare level keywords, the last resort before the content heuristics. This
+# one has no literal prefix and is slow, so it is only run (on the
+# upper-cased message) when one of the keywords occurs at all.
+_LEVEL_KEYWORDS = ("ERROR", "WARN", "INFO", "DEBUG", "TRACE")
+_LEVEL_WORD_RE = re.compile(r'\b(ERROR|WARN|WARNING|INFO|DEBUG|TRACE)\b')
+
+# One shared Text per known level for the Level column (Rich only reads
+# cell renderables, so the same object can appear in many rows)
+_LEVEL_TEXTS = {level: Text(level, style=style) for level, style in LEVEL_COLORS.items()}
+
+# Message style per level in the log table
+_MESSAGE_STYLES = {"ERROR": "red", "WARN": "yellow"}
+
+# Rows per table printed by display_logs, so a long log dump does not keep
+# every rendered row in memory until the end
+LOG_CHUNK_ROWS = 500
+
+# Compiled once instead of on every event
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
 
 def extract_log_level(message: str) -> str:
     """Extract log level from message."""
-    message_upper = message.upper()
-    
     for pattern in LEVEL_PATTERNS:
-        match = re.search(pattern, message, re.IGNORECASE)
+        match = pattern.search(message)
         if match:
             level = match.group(1).upper()
             if level in LEVEL_COLORS:
                 return level
-            # Map common variations
-            if level == "WARNING":
-                return "WARN"
+    
+    message_upper = message.upper()
+    if any(keyword in message_upper for keyword in _LEVEL_KEYWORDS):
+        match = _LEVEL_WORD_RE.search(message_upper)
+        if match:
+            return match.group(1)
     
     # Default based on content
     if "ERROR" in message_upper or "EXCEPTION" in message_upper or "FAILED" in message_upper:
@@ -56,18 +87,44 @@ def extract_log_level(message: str) -> str:
     return "INFO"
 
 
+def _json_loads(text: str) -> Any:
+    """Decode JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _pretty_json(data: Any) -> str:
+    """Indent JSON for display, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def parse_json_log(message: str) -> dict[str, Any] | None:
     """Try to parse message as JSON."""
+    # The JSON object spans from the first '{' to the last '}'; most plain
+    # text lines have no brace at all and return after one scan
+    start = message.find("{")
+    if start < 0:
+        return None
+    end = message.rfind("}")
+    if end < start:
+        return None
+    
     try:
-        # Find JSON in the message
-        json_match = re.search(r'\{.*\}', message, re.DOTALL)
-        if json_match:
-            return json.loads(json_match.group())
-    except json.JSONDecodeError:
+        return _json_loads(message[start:end + 1])
+    except json.JSONDecodeError:  # orjson's decode error subclasses it
         pass
     return None
 
 
+@lru_cache(maxsize=4096)
+def _format_epoch_second(second: int) -> str:
+    """Format a whole epoch second; events of one batch share many of them."""
+    return datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+
+
 def format_timestamp(timestamp: int | float | str) -> str:
     """Format timestamp to readable string."""
     try:
@@ -75,20 +132,30 @@ def format_timestamp(timestamp: int | float | str) -> str:
             # CloudWatch timestamps are in milliseconds
             if timestamp > 1e12:
                 timestamp = timestamp / 1000
-            dt = datetime.fromtimestamp(timestamp)
-        else:
-            dt = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+            # Sub-second precision is not displayed
+            return _format_epoch_second(math.floor(timestamp))
+        
+        # fromisoformat only accepts a trailing "Z" from Python 3.11 on
+        text = timestamp if isinstance(timestamp, str) else str(timestamp)
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        dt = datetime.fromisoformat(text)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
     except (ValueError, OSError):
         return str(timestamp)
 
 
-def format_log_entry(event: dict, show_json: bool = True) -> dict:
-    """
-    Format a single log event for display.
+class FormattedEvent(NamedTuple):
+    """A log event formatted for display."""
     
-    Returns dict with: timestamp, level, message, json_data
-    """
+    timestamp: str
+    level: str
+    message: str
+    json_data: Any
+
+
+def format_log_entry(event: dict, show_json: bool = True) -> FormattedEvent:
+    """Format a single log event for display."""
     timestamp = format_timestamp(event.get("timestamp", 0))
     message = event.get("message", "")
     
@@ -101,28 +168,47 @@ def format_log_entry(event: dict, show_json: bool = True) -> dict:
         level = json_data["level"].upper()
     
     # Clean message for display
-    # Strip ANSI codes for clean display in Rich
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    clean_message = ansi_escape.sub('', message).strip()
+    # Strip ANSI codes for clean display in Rich (most lines have no ESC)
+    if "\x1b" in message:
+        message = _ANSI_ESCAPE_RE.sub('', message)
+    clean_message = message.strip()
     
     # Do NOT truncate heavily here, let Rich table handle folding.
     # We only truncate if it's absurdly long to prevent memory issues, e.g. 5000 chars.
     if len(clean_message) > 5000 and not json_data:
         clean_message = clean_message[:5000] + "..."
     
-    return {
-        "timestamp": timestamp,
-        "level": level,
-        "message": clean_message,
-        "json_data": json_data,
-    }
+    return FormattedEvent(timestamp, level, clean_message, json_data)
 
 
-def create_log_table(events: list[dict], service_name: str, cluster_name: str) -> Table:
-    """Create a Rich table with formatted logs."""
+def iter_formatted(events: Iterable[dict], pretty_json: bool = False) -> Iterator[tuple[str, str, str]]:
+    """
+    Yield (timestamp, level, message) for each event, as shown in the log table.
+    
+    Messages are shown as logged; with `pretty_json`, JSON messages are parsed
+    and come out indented and cut at 500 characters.
+    """
+    for event in events:
+        timestamp, level, message, json_data = format_log_entry(event, show_json=pretty_json)
+        
+        if json_data:
+            # Show formatted JSON
+            try:
+                formatted = _pretty_json(json_data)
+                if len(formatted) > 500:
+                    formatted = formatted[:500] + "\n..."
+                message = formatted
+            except (TypeError, ValueError):
+                pass
+        
+        yield timestamp, level, message
+
+
+def _log_table(title: Optional[str] = None) -> Table:
+    """Create an empty log table; continuation chunks have no title or header."""
     table = Table(
-        title=f"📋 ECS Logs - {service_name} | {cluster_name}",
-        show_header=True,
+        title=title,
+        show_header=title is not None,
         header_style="bold cyan",
         border_style="dim",
         expand=True,
@@ -130,52 +216,51 @@ def create_log_table(events: list[dict], service_name: str, cluster_name: str) -
     
     table.add_column("Timestamp", style="dim", width=20, no_wrap=True)
     table.add_column("Level", width=7, justify="center")
-    table.add_column("Message", overflow="fold")
+    # Only the message column takes the spare width (ratio), so the other
+    # widths stay fixed and consecutive chunks line up
+    table.add_column("Message", overflow="fold", ratio=1)
+    return table
+
+
+def _add_log_row(table: Table, timestamp: str, level: str, message: str):
+    """Append one formatted event to a log table."""
+    level_text = _LEVEL_TEXTS.get(level) or Text(level, style="white")
     
-    for event in events:
-        formatted = format_log_entry(event)
-        
-        level = formatted["level"]
-        level_style = LEVEL_COLORS.get(level, "white")
-        level_text = Text(level, style=level_style)
-        
-        # Format message
-        message = formatted["message"]
-        if formatted["json_data"]:
-            # Show formatted JSON
-            try:
-                pretty_json = json.dumps(formatted["json_data"], indent=2, ensure_ascii=False)
-                if len(pretty_json) > 500:
-                    pretty_json = pretty_json[:500] + "\n..."
-                message = pretty_json
-            except (TypeError, ValueError):
-                pass
-        
-        # Color message based on level
-        if level == "ERROR":
-            message_text = Text(message, style="red")
-        elif level == "WARN":
-            message_text = Text(message, style="yellow")
-        else:
-            message_text = Text(message)
-        
-        table.add_row(
-            formatted["timestamp"],
-            level_text,
-            message_text,
-        )
+    # Color message based on level (a Text, so brackets in it are not markup)
+    message_text = Text(message, style=_MESSAGE_STYLES.get(level, ""))
     
+    table.add_row(
+        timestamp,
+        level_text,
+        message_text,
+    )
+
+
+def create_log_table(
+    events: list[dict], service_name: str, cluster_name: str, pretty_json: bool = False
+) -> Table:
+    """Create a Rich table with formatted logs."""
+    table = _log_table(f"📋 ECS Logs - {service_name} | {cluster_name}")
+    for row in iter_formatted(events, pretty_json):
+        _add_log_row(table, *row)
     return table
 
 
-def display_logs(events: list[dict], service_name: str, cluster_name: str):
+def display_logs(events: list[dict], service_name: str, cluster_name: str, pretty_json: bool = False):
     """Display formatted logs to console."""
     if not events:
         console.print("[yellow]⚠ Nenhum log encontrado.[/yellow]")
         return
     
-    table = create_log_table(events, service_name, cluster_name)
-    console.print(table)
+    # Print every LOG_CHUNK_ROWS rows instead of building one huge table
+    table = _log_table(f"📋 ECS Logs - {service_name} | {cluster_name}")
+    for row in iter_formatted(events, pretty_json):
+        _add_log_row(table, *row)
+        if table.row_count == LOG_CHUNK_ROWS:
+            console.print(table)
+            table = _log_table()
+    if table.row_count:
+        console.print(table)
     console.print(f"\n[dim]Total: {len(events)} eventos[/dim]")
 
 
@@ -183,13 +268,13 @@ def display_log_detail(event: dict):
     """Display a single log event in detail with JSON highlighting."""
     formatted = format_log_entry(event, show_json=True)
     
-    console.print(f"\n[dim]Timestamp:[/dim] {formatted['timestamp']}")
-    console.print(f"[dim]Level:[/dim] [{LEVEL_COLORS.get(formatted['level'], 'white')}]{formatted['level']}[/]")
+    console.print(f"\n[dim]Timestamp:[/dim] {formatted.timestamp}")
+    console.print(f"[dim]Level:[/dim] [{LEVEL_COLORS.get(formatted.level, 'white')}]{formatted.level}[/]")
     
-    if formatted["json_data"]:
+    if formatted.json_data:
         console.print("\n[dim]JSON Content:[/dim]")
-        json_str = json.dumps(formatted["json_data"], indent=2, ensure_ascii=False)
+        json_str = _pretty_json(formatted.json_data)
         syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
         console.print(Panel(syntax, border_style="dim"))
     else:
-        console.print(f"\n[dim]Message:[/dim]\n{formatted['message']}")
+        console.print(f"\n[dim]Message:[/dim]\n{formatted.message}")
@@ -0,0 +1,36 @@
+"""Run AWS calls in background threads while the user answers a prompt."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator
+
+
+def _submit_all(
+    calls: dict[Hashable, Callable[[], Any]], max_workers: int,
+) -> tuple[ThreadPoolExecutor, dict[Hashable, Future]]:
+    """Submit every call to a new pool; returns the pool and the futures by key."""
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(calls))))
+    return executor, {key: executor.submit(call) for key, call in calls.items()}
+
+
+def background(calls: dict[Hashable, Callable[[], Any]], max_workers: int = 8) -> dict[Hashable, Future]:
+    """Start every call in `calls` and return their futures; all of them run to the end."""
+    executor, futures = _submit_all(calls, max_workers)
+    executor.shutdown(wait=False)
+    return futures
+
+
+@contextmanager
+def prefetch(calls: dict[Hashable, Callable[[], Any]], max_workers: int = 8) -> Iterator[dict[Hashable, Future]]:
+    """
+    Start every call in `calls` and yield their futures by key.
+    
+    Leaving the block cancels the calls that have not started and does not
+    wait for the running ones, so an early answer never blocks on work that
+    is no longer needed.
+    """
+    executor, futures = _submit_all(calls, max_workers)
+    try:
+        yield futures
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
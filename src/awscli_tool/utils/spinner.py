@@ -0,0 +1,31 @@
+"""Shared transient spinner for slow AWS calls."""
+
+from contextlib import contextmanager
+
+from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn
+
+console = Console()
+
+# One Progress for the whole process: its columns and live display are set
+# up once and only started while a spinner block is running (a live display
+# left running would fight with the InquirerPy prompts between steps)
+_progress = Progress(
+    SpinnerColumn(),
+    TextColumn("[progress.description]{task.description}"),
+    console=console,
+    transient=True,
+)
+
+
+@contextmanager
+def spinner(message: str):
+    """Show a transient spinner with `message` while the block runs."""
+    task = _progress.add_task(message, total=None)
+    _progress.start()
+    try:
+        yield _progress
+    finally:
+        _progress.remove_task(task)
+        if not _progress.tasks:
+            _progress.stop()
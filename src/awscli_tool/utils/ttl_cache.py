@@ -0,0 +1,62 @@
+"""Small time-based cache for AWS listing calls."""
+
+import time
+from functools import wraps
+from typing import Any, Callable
+
+# Every ttl_cached function, so they can all be invalidated at once
+_CACHED: list[Callable] = []
+
+
+def ttl_cached(seconds: float) -> Callable:
+    """
+    Cache a function's results for `seconds`.
+    
+    The first positional argument must be the boto3 client; the key holds
+    the client itself (not its id, which a new client could reuse after
+    reset_clients) so different profiles never share entries. Empty
+    results are not cached, since listing helpers return [] when the API
+    call fails.
+    
+    The wrapped function gains an `invalidate(client=None)` method that
+    drops the entries of one client (or all of them). Expired entries are
+    dropped whenever a call misses the cache.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: dict[tuple, tuple[float, Any]] = {}
+        
+        @wraps(func)
+        def wrapper(client, *args, **kwargs):
+            key = (client, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            
+            hit = cache.get(key)
+            if hit and now - hit[0] < seconds:
+                return hit[1]
+            
+            for stale in [k for k, (stamp, _) in list(cache.items()) if now - stamp >= seconds]:
+                cache.pop(stale, None)
+            
+            value = func(client, *args, **kwargs)
+            if value:
+                cache[key] = (now, value)
+            return value
+        
+        def invalidate(client=None):
+            if client is None:
+                cache.clear()
+                return
+            for key in [k for k in list(cache) if k[0] is client]:
+                cache.pop(key, None)
+        
+        wrapper.invalidate = invalidate
+        _CACHED.append(wrapper)
+        return wrapper
+    
+    return decorator
+
+
+def invalidate_all():
+    """Drop every entry of every ttl_cached function (and the clients their keys hold)."""
+    for cached in _CACHED:
+        cached.invalidate()